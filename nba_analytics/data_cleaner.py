@@ -7,19 +7,64 @@ Author: Christopher Bratkovics
 Created: 2025
 """
 
+import hashlib
+import importlib.util
+import json
 import logging
+import re
+import sys
+import time
+import weakref
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Union, Any, Callable
+from typing import Dict, List, Optional, Tuple, Union, Any, Callable, TYPE_CHECKING
 import warnings
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, asdict
 from abc import ABC, abstractmethod
+from functools import lru_cache, partial
 
+import joblib
 import numpy as np
 import pandas as pd
 from sklearn.base import BaseEstimator, TransformerMixin
 from sklearn.preprocessing import StandardScaler
-import matplotlib.pyplot as plt
-import seaborn as sns
+
+# Arrow-backed strings route .str methods through Arrow compute kernels when available;
+# pyarrow also writes parquet/feather output directly from an Arrow table
+try:
+    import pyarrow as pa
+    import pyarrow.feather as pa_feather
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+# Polars is an optional lazy backend for NBADataCleaner.transform. It is only
+# imported by the polars code paths, so the pandas backend does not pay for it
+POLARS_AVAILABLE = importlib.util.find_spec('polars') is not None
+if TYPE_CHECKING:
+    import polars as pl
+
+# xxh3 is preferred for cache fingerprints; hashlib's blake2b is the fallback
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
+# orjson serializes cleaning reports several times faster than the stdlib encoder
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# numexpr evaluates the outlier cap as a single expression tree when available
+try:
+    import numexpr
+    NUMEXPR_AVAILABLE = True
+except ImportError:
+    NUMEXPR_AVAILABLE = False
 
 # Configure logging with INFO level for tracking pipeline progress
 logging.basicConfig(level=logging.INFO)
@@ -28,14 +73,338 @@ logger = logging.getLogger(__name__)
 # Suppress common warnings for cleaner output during processing
 warnings.filterwarnings('ignore', category=pd.errors.PerformanceWarning)
 
+# Copy-on-Write lets transformers share untouched column blocks instead of
+# deep-copying the whole frame at every pipeline stage (pandas 2.0+)
+COPY_ON_WRITE_ENABLED = int(pd.__version__.split('.')[0]) >= 2
+if COPY_ON_WRITE_ENABLED:
+    pd.set_option('mode.copy_on_write', True)
+
+# Slotted dataclasses require Python 3.10+; older interpreters fall back to __dict__
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@lru_cache(maxsize=None)
+def _outside_bounds_kernel() -> Optional[Callable]:
+    """Compile the fused outlier-mask kernel on first use, or None without numba.
+    
+    Numba is an optional dependency and is only imported here, so importing this
+    module does not pay for it. The kernel is not cached on disk because numba's
+    cache records the importing module's name, which differs between the
+    notebooks (data_cleaner) and the package (nba_analytics.data_cleaner).
+    """
+    try:
+        from numba import guvectorize
+    except ImportError:
+        return None
+    
+    @guvectorize(
+        ['void(float32[:], float32, float32, boolean[:])',
+         'void(float64[:], float64, float64, boolean[:])'],
+        '(n),(),()->(n)',
+        nopython=True
+    )
+    def kernel(values, lower, upper, out):
+        """Flag values outside [lower, upper] in a single compiled pass."""
+        for i in range(values.shape[0]):
+            out[i] = values[i] < lower or values[i] > upper
+    
+    return kernel
+
+
+def _clean_text_columns(X: pd.DataFrame, columns: List[str]) -> pd.DataFrame:
+    """Strip whitespace and normalize missing-value placeholders in text columns.
+    
+    Columns are converted to pandas' string dtype so missing values become pd.NA
+    directly, and the literal placeholders 'nan', 'None' and '' are masked in the
+    same pass as the strip.
+    """
+    string_dtype = pd.StringDtype('pyarrow') if PYARROW_AVAILABLE else pd.StringDtype()
+    for col in columns:
+        if col in X.columns:
+            text = X[col].astype(string_dtype).str.strip()
+            X[col] = text.mask(text.isin(['nan', 'None', '']))
+    return X
+
+
+def _clean_text_exprs(columns: List[str], schema: Dict[str, Any]) -> List['pl.Expr']:
+    """Polars expressions matching _clean_text_columns for the columns present in schema."""
+    import polars as pl
+    exprs = []
+    for col in columns:
+        if col in schema:
+            text = pl.col(col).cast(pl.String).str.strip_chars()
+            exprs.append(pl.when(text.is_in(['nan', 'None', ''])).then(None).otherwise(text).alias(col))
+    return exprs
+
+
+def _packed_int_keys(df: pd.DataFrame, a_col: str, b_col: str) -> Optional[np.ndarray]:
+    """Pack an (a_col, b_col) integer pair into one int64 key per row.
+    
+    Returns None unless both columns are non-negative integers without missing
+    values and small enough to share 64 bits.
+    """
+    a, b = df[a_col], df[b_col]
+    if (len(df) > 0 and pd.api.types.is_integer_dtype(a) and pd.api.types.is_integer_dtype(b)
+            and not (a.hasnans or b.hasnans)):
+        a_values = a.to_numpy(dtype=np.int64)
+        b_values = b.to_numpy(dtype=np.int64)
+        if (a_values.min() >= 0 and b_values.min() >= 0
+                and a_values.max() < 2**31 and b_values.max() < 2**32):
+            return (a_values << 32) | b_values
+    return None
+
+
+def _dedup_on_int_keys(df: pd.DataFrame, a_col: str, b_col: str) -> Tuple[pd.DataFrame, int]:
+    """Drop duplicate (a_col, b_col) pairs, keeping the first occurrence.
+    
+    When both columns are non-negative integers without missing values, the pair
+    is packed into a single int64 key and deduplicated with one np.unique pass.
+    Other inputs fall back to a single DataFrame.duplicated call.
+    
+    Returns:
+        Tuple of (deduplicated DataFrame, number of rows removed)
+    """
+    keys = _packed_int_keys(df, a_col, b_col)
+    if keys is not None:
+        _, first_idx = np.unique(keys, return_index=True)
+        dup_count = len(df) - len(first_idx)
+        if dup_count > 0:
+            df = df.iloc[np.sort(first_idx)]
+        return df, dup_count
+    
+    duplicated = df.duplicated(subset=[a_col, b_col]).to_numpy()
+    dup_count = int(duplicated.sum())
+    if dup_count > 0:
+        df = df[~duplicated]
+    return df, dup_count
+
+
+def _sort_by_date_and_player(df: pd.DataFrame) -> pd.DataFrame:
+    """Sort by (game_date, player_id) with np.lexsort on int64 views of both keys.
+    
+    Missing dates and player IDs are mapped to the largest int64 so they sort
+    last, matching DataFrame.sort_values. Non-datetime or non-integer keys fall
+    back to sort_values.
+    """
+    dates, players = df['game_date'], df['player_id']
+    if not (pd.api.types.is_datetime64_dtype(dates) and pd.api.types.is_integer_dtype(players)):
+        return df.sort_values(['game_date', 'player_id']).reset_index(drop=True)
+    
+    na_last = np.iinfo(np.int64).max
+    date_values = dates.to_numpy(dtype='datetime64[ns]')
+    date_keys = np.where(np.isnat(date_values), na_last, date_values.view('i8'))
+    player_keys = players.to_numpy(dtype=np.int64, na_value=na_last)
+    
+    # np.lexsort sorts by the last key first
+    order = np.lexsort((player_keys, date_keys))
+    return df.take(order).reset_index(drop=True)
+
+
+def _fast_hash(data: bytes) -> str:
+    """Return a 128-bit hex digest of data, using xxh3 when installed."""
+    if XXHASH_AVAILABLE:
+        return xxhash.xxh3_128_hexdigest(data)
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def _frame_fingerprint(X: pd.DataFrame) -> str:
+    """Content fingerprint of a DataFrame for stage caching.
+    
+    Combines shape, column names and dtypes with per-row hashes of every value
+    and index label, so a change to any single cell gives a new fingerprint.
+    """
+    row_hashes = pd.util.hash_pandas_object(X, index=True).to_numpy()
+    schema = repr((X.shape, list(X.columns), [str(dtype) for dtype in X.dtypes]))
+    return _fast_hash(schema.encode() + row_hashes.tobytes())
+
+
+def _like_column(values: np.ndarray, dtype) -> Union[np.ndarray, pd.api.extensions.ExtensionArray]:
+    """Convert a numpy result back to its column's dtype before assignment.
+    
+    Arrow-backed and nullable dtypes read NaN in the result as a missing value.
+    """
+    if isinstance(dtype, np.dtype):
+        return values.astype(dtype, copy=False)
+    return pd.array(values, dtype=dtype)
+
+
+def _null_counts(df: pd.DataFrame) -> Tuple[pd.Series, int]:
+    """Return per-column and total missing-value counts.
+    
+    DataFrame.count() reduces each block directly, so unlike isnull().sum()
+    no frame-sized boolean mask is allocated.
+    """
+    missing = len(df) - df.count()
+    return missing, int(missing.sum())
+
+
+def _json_default(obj: Any) -> Any:
+    """Convert pandas/NumPy values that json cannot serialize natively."""
+    if isinstance(obj, pd.Timestamp):
+        return obj.isoformat()
+    if isinstance(obj, np.integer):
+        return int(obj)
+    if isinstance(obj, np.floating):
+        return float(obj)
+    if isinstance(obj, np.bool_):
+        return bool(obj)
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
 
-@dataclass
+
+def _validate_shot_pair(X: pd.DataFrame, made_col: str, attempt_col: str,
+                        auto_fix: bool, count_issues: bool) -> Tuple[str, Optional[np.ndarray], Optional[str]]:
+    """Check that makes never exceed attempts for one shot type.
+    
+    Only reads X; the caller assigns the fixed values.
+    
+    Returns:
+        Tuple of (made column, fixed values or None, issue message or None)
+    """
+    made = _float_values(X[made_col])
+    attempts = _float_values(X[attempt_col])
+    invalid_shots = made > attempts
+    
+    issue = None
+    if count_issues:
+        invalid_count = int(invalid_shots.sum())
+        if invalid_count > 0:
+            issue = f"Found {invalid_count} records where {made_col} > {attempt_col}"
+    
+    # np.where rather than np.minimum so missing values are left untouched
+    fixed = np.where(invalid_shots, attempts, made) if auto_fix else None
+    return made_col, fixed, issue
+
+
+def _validate_rebound_total(X: pd.DataFrame, auto_fix: bool,
+                            count_issues: bool) -> Tuple[str, Optional[np.ndarray], Optional[str]]:
+    """Check that total rebounds equal offensive plus defensive rebounds.
+    
+    Returns:
+        Tuple of ('reb', fixed values or None, issue message or None)
+    """
+    # Float arrays with NaN for missing values, so nullable integer columns work too
+    reb = _float_values(X['reb'])
+    calculated_reb = np.add(_float_values(X['oreb']), _float_values(X['dreb']))
+    
+    # Reuse one scratch buffer for the difference and its absolute value
+    reb_diff = np.subtract(reb, calculated_reb)
+    np.abs(reb_diff, out=reb_diff)
+    reb_mismatch = reb_diff > 0.1
+    
+    # A missing total is filled from its parts whenever both parts are known
+    reb_mismatch |= np.isnan(reb) & ~np.isnan(calculated_reb)
+    
+    issue = None
+    if count_issues:
+        mismatch_count = int(reb_mismatch.sum())
+        if mismatch_count > 0:
+            issue = f"Found {mismatch_count} records with rebound calculation mismatches"
+    
+    if not auto_fix:
+        return 'reb', None, issue
+    
+    return 'reb', np.where(reb_mismatch, calculated_reb, reb), issue
+
+
+def _outside_bounds_mask(values: np.ndarray, lower: float, upper: float) -> np.ndarray:
+    """Return a boolean mask of values outside [lower, upper]; NaN is never flagged."""
+    if values.dtype not in (np.float32, np.float64):
+        values = values.astype(np.float64)
+    kernel = _outside_bounds_kernel()
+    if kernel is not None:
+        cast = values.dtype.type
+        with np.errstate(invalid='ignore'):
+            return kernel(values, cast(lower), cast(upper))
+    return (values < lower) | (values > upper)
+
+
+def _iqr_bounds(values: np.ndarray, threshold: float) -> Tuple[float, float]:
+    """Return Q1 - threshold*IQR and Q3 + threshold*IQR."""
+    # Both quartiles come from one partition of the underlying array
+    Q1, Q3 = np.quantile(values, [0.25, 0.75])
+    IQR = Q3 - Q1
+    return Q1 - threshold * IQR, Q3 + threshold * IQR
+
+
+def _zscore_bounds(values: np.ndarray, threshold: float) -> Tuple[float, float]:
+    """Return mean -/+ threshold standard deviations (sample std, as pandas)."""
+    mean = values.mean()
+    std = values.std(ddof=1)
+    return mean - threshold * std, mean + threshold * std
+
+
+def _float_values(column: pd.Series) -> np.ndarray:
+    """Return a column as a float array with NaN for missing values.
+    
+    Float columns keep their own precision, so float32 data stays float32.
+    """
+    dtype = column.dtype
+    if isinstance(dtype, np.dtype) and dtype.kind == 'f':
+        return column.to_numpy()
+    float_dtype = getattr(dtype, 'numpy_dtype', dtype) if dtype.kind == 'f' else np.float64
+    return column.to_numpy(dtype=float_dtype, na_value=np.nan)
+
+
+def _flag_outliers(X: pd.DataFrame, bounds: Tuple[Tuple[str, float, float], ...],
+                   count_outliers: bool) -> Tuple[pd.DataFrame, Dict[str, int]]:
+    """Add an {col}_outlier_flag column for each bounded column."""
+    outlier_summary = {}
+    for col, lower_bound, upper_bound in bounds:
+        if col in X.columns:
+            outliers_mask = _outside_bounds_mask(_float_values(X[col]), lower_bound, upper_bound)
+            X[f'{col}_outlier_flag'] = outliers_mask
+            if count_outliers:
+                outlier_summary[col] = int(outliers_mask.sum())
+    return X, outlier_summary
+
+
+def _cap_outliers(X: pd.DataFrame, bounds: Tuple[Tuple[str, float, float], ...],
+                  count_outliers: bool) -> Tuple[pd.DataFrame, Dict[str, int]]:
+    """Clip each bounded column to its bounds."""
+    outlier_summary = {}
+    for col, lower_bound, upper_bound in bounds:
+        if col in X.columns:
+            column = X[col]
+            if count_outliers:
+                outliers_mask = _outside_bounds_mask(_float_values(column), lower_bound, upper_bound)
+                outlier_summary[col] = int(outliers_mask.sum())
+            if NUMEXPR_AVAILABLE and isinstance(column.dtype, np.dtype) and column.dtype.kind == 'f':
+                # Bounds as array-dtype scalars keep numexpr from upcasting float32
+                cast = column.dtype.type
+                X[col] = numexpr.evaluate(
+                    "where(x < lb, lb, where(x > ub, ub, x))",
+                    local_dict={'x': column.to_numpy(), 'lb': cast(lower_bound), 'ub': cast(upper_bound)}
+                )
+            else:
+                X[col] = column.clip(lower_bound, upper_bound)
+    return X, outlier_summary
+
+
+def _remove_outliers(X: pd.DataFrame, bounds: Tuple[Tuple[str, float, float], ...],
+                     count_outliers: bool) -> Tuple[pd.DataFrame, Dict[str, int]]:
+    """Drop rows outside the bounds, column by column."""
+    outlier_summary = {}
+    for col, lower_bound, upper_bound in bounds:
+        if col in X.columns:
+            outliers_mask = _outside_bounds_mask(_float_values(X[col]), lower_bound, upper_bound)
+            if count_outliers:
+                outlier_summary[col] = int(outliers_mask.sum())
+            X = X[~outliers_mask]
+    return X, outlier_summary
+
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class CleaningConfig:
     """Configuration class for data cleaning parameters.
     
     This dataclass holds all configurable thresholds and settings used
     throughout the data cleaning pipeline, making it easy to adjust
-    cleaning behavior without modifying code.
+    cleaning behavior without modifying code. Instances are immutable;
+    use dataclasses.replace() to derive a modified configuration.
     """
     
     # Validation thresholds for game statistics
@@ -44,6 +413,13 @@ class CleaningConfig:
     max_reasonable_rebounds: int = 30
     max_reasonable_assists: int = 25
     
+    # Storage configuration: shrink numeric columns to float32 / int16 / int32
+    # right after type conversion so every later stage moves fewer bytes
+    downcast_numeric_dtypes: bool = True
+    
+    # Run the pipeline on PyArrow-backed dtypes (requires pyarrow)
+    use_arrow_backend: bool = False
+    
     # Missing value handling configuration
     fill_counting_stats_with_zero: bool = True
     drop_threshold_missing_pct: float = 95.0  # Drop columns missing >95% data
@@ -77,11 +453,17 @@ class BaseNBATransformer(BaseEstimator, TransformerMixin, ABC):
     
     This base class provides common functionality for all NBA data transformers,
     including input validation, logging, and sklearn-compatible interfaces.
+    
+    With pandas Copy-on-Write enabled, inputs are only shallow-copied up front.
+    Subclasses must therefore modify data through column assignment
+    (X[col] = ...) and never write into arrays obtained from the input frame.
     """
     
-    def __init__(self, config: Optional[CleaningConfig] = None, verbose: bool = True):
+    def __init__(self, config: Optional[CleaningConfig] = None, verbose: bool = True,
+                 copy_on_validate: bool = False):
         self.config = config or CleaningConfig()
         self.verbose = verbose
+        self.copy_on_validate = copy_on_validate
         self.feature_names_in_: Optional[List[str]] = None
         self.n_features_in_: Optional[int] = None
         self.is_fitted_: bool = False
@@ -102,7 +484,11 @@ class BaseNBATransformer(BaseEstimator, TransformerMixin, ABC):
                 if missing_cols and self.config.strict_validation:
                     raise ValueError(f"Missing required columns: {missing_cols}")
         
-        return X.copy()
+        # Under Copy-on-Write a shallow copy shares all blocks until a column is
+        # written; without it, only a deep copy keeps the caller's frame intact
+        if self.copy_on_validate or not COPY_ON_WRITE_ENABLED:
+            return X.copy()
+        return X.copy(deep=False)
     
     def _store_input_info(self, X: pd.DataFrame) -> None:
         """Store information about input features for sklearn compatibility."""
@@ -115,6 +501,16 @@ class BaseNBATransformer(BaseEstimator, TransformerMixin, ABC):
         """Implementation of the transformation logic. Must be overridden by subclasses."""
         pass
     
+    def _transform_impl_pl(self, lf: 'pl.LazyFrame') -> 'pl.LazyFrame':
+        """Polars counterpart of _transform_impl used by the lazy pipeline backend.
+        
+        The default collects the query so far, applies the pandas transform
+        and continues lazily from its result, so transformers without a
+        polars implementation still work with the polars backend.
+        """
+        import polars as pl
+        return pl.from_pandas(self.transform(lf.collect().to_pandas())).lazy()
+    
     def fit(self, X: pd.DataFrame, y=None):
         """Fit the transformer to learn parameters from the data."""
         X = self._validate_input(X)
@@ -134,6 +530,11 @@ class BaseNBATransformer(BaseEstimator, TransformerMixin, ABC):
         return self.fit(X, y).transform(X)
 
 
+# "MM", "MM.m" or "MM:SS"; anything after a second colon is ignored
+_NUMBER_PATTERN = r'[+-]?(?:\d+\.?\d*|\.\d+)'
+_MIN_RE = re.compile(rf'^\s*({_NUMBER_PATTERN})(?:\s*:\s*({_NUMBER_PATTERN})(?::.*)?)?\s*$')
+
+
 class MinutesConverter:
     """Utility class for converting NBA minutes data from various formats."""
     
@@ -160,27 +561,69 @@ class MinutesConverter:
         if pd.isna(minutes_value) or minutes_value == '':
             return 0.0
         
-        minutes_str = str(minutes_value).strip()
+        if isinstance(minutes_value, (int, float, np.number)):
+            return float(minutes_value)
         
-        try:
-            if ':' in minutes_str:
-                parts = minutes_str.split(':')
-                minutes = float(parts[0])
-                seconds = float(parts[1]) if len(parts) > 1 else 0
-                return minutes + (seconds / 60)
-            else:
-                return float(minutes_str)
-        except (ValueError, IndexError) as e:
-            logger.warning(f"Could not convert minutes value '{minutes_value}': {e}")
+        # One regex match decides validity up front, so malformed values never
+        # raise and unwind an exception
+        match = _MIN_RE.match(str(minutes_value))
+        if match is None:
+            logger.warning(f"Could not convert minutes value '{minutes_value}'")
             return 0.0
+        
+        minutes, seconds = match.groups()
+        return float(minutes) + float(seconds or 0) / 60
+
+    @staticmethod
+    def convert_series_to_decimal(minutes: pd.Series) -> pd.Series:
+        """
+        Vectorized counterpart of convert_to_decimal for a whole column.
+
+        Parses "MM:SS" strings and plain numbers with pandas string ops instead
+        of calling convert_to_decimal once per row. Missing or unparseable
+        values become 0.0.
+
+        Args:
+            minutes: Series of minutes in string or numeric format
+
+        Returns:
+            Series of decimal minutes aligned with the input index
+        """
+        if pd.api.types.is_numeric_dtype(minutes):
+            return minutes.astype('float64').fillna(0.0)
+
+        missing_mask = minutes.isna()
+        minutes_str = minutes.astype(str).str.strip()
+        parts = minutes_str.str.split(':', n=2, expand=True)
+        if parts.shape[1] == 0:
+            # An empty column splits into a frame without columns
+            return pd.Series(dtype='float64', index=minutes.index)
+
+        whole_minutes = pd.to_numeric(parts[0], errors='coerce')
+        if parts.shape[1] > 1:
+            has_seconds = parts[1].notna()
+            seconds = pd.to_numeric(parts[1], errors='coerce')
+            decimal = whole_minutes + (seconds / 60).where(has_seconds, 0.0)
+        else:
+            decimal = whole_minutes
+
+        invalid_mask = decimal.isna() & ~missing_mask & (minutes_str != '')
+        if invalid_mask.any():
+            logger.warning(f"Could not convert {int(invalid_mask.sum())} minutes values; using 0.0")
+
+        return decimal.fillna(0.0)
 
 
 class DataTypeConverter(BaseNBATransformer):
     """Convert data types and format columns appropriately for NBA statistics."""
     
-    def __init__(self, **kwargs):
+    def __init__(self, clean_text: bool = False, **kwargs):
         super().__init__(**kwargs)
         
+        # Text cleaning is normally left to TextDataCleaner; pipelines without
+        # one set clean_text so placeholders like 'nan' still become missing
+        self.clean_text = clean_text
+        
         # Define column categories for appropriate type conversion
         self.id_columns = [
             'id', 'player_id', 'player_team_id', 'team_id', 
@@ -198,24 +641,40 @@ class DataTypeConverter(BaseNBATransformer):
             'team_abbreviation', 'team_full_name'
         ]
     
+    def _dtype(self, name: str) -> str:
+        """Map a numpy/nullable dtype name to its PyArrow equivalent when configured."""
+        if not self.config.use_arrow_backend:
+            return name
+        return f"{name.lower()}[pyarrow]"
+    
     def _transform_impl(self, X: pd.DataFrame) -> pd.DataFrame:
         """Convert data types for NBA statistics ensuring proper formats."""
         self._log("Converting data types...")
         
-        # Convert ID columns to nullable integers to handle missing values
-        for col in self.id_columns:
-            if col in X.columns:
-                X[col] = pd.to_numeric(X[col], errors='coerce').astype('Int64')
-        
-        # Convert statistical columns to numeric, coercing errors to NaN
-        for col in self.stat_columns:
-            if col in X.columns:
-                X[col] = pd.to_numeric(X[col], errors='coerce')
+        # Every transformer works column by column, so keep columns contiguous
+        X = self._ensure_column_major(X)
+        
+        # Convert ID columns to nullable integers to handle missing values.
+        # Numeric columns cast straight to Int64; only the rest need parsing,
+        # which is done in one batch so the astype runs once across them.
+        id_cols = [col for col in self.id_columns if col in X.columns]
+        to_parse = [col for col in id_cols if X[col].dtype.kind not in 'iuf']
+        if to_parse:
+            X[to_parse] = X[to_parse].apply(pd.to_numeric, errors='coerce')
+        if id_cols:
+            X[id_cols] = X[id_cols].astype(self._dtype('Int64'))
+        
+        # Convert statistical columns to numeric, coercing errors to NaN, in one
+        # frame-level assignment rather than one block write per column
+        present = X.columns.intersection(self.stat_columns)
+        to_parse = [col for col in present if X[col].dtype.kind not in 'iufb']
+        if to_parse:
+            X[to_parse] = X[to_parse].apply(pd.to_numeric, errors='coerce')
         
         # Handle minutes played conversion from string to decimal format
         if 'min' in X.columns:
             self._log("Converting minutes to decimal format...")
-            X['minutes_played'] = X['min'].apply(MinutesConverter.convert_to_decimal)
+            X['minutes_played'] = MinutesConverter.convert_series_to_decimal(X['min']).astype(self._dtype('float64'))
             X = X.drop('min', axis=1)
         
         # Convert date column to datetime for proper temporal handling
@@ -224,21 +683,176 @@ class DataTypeConverter(BaseNBATransformer):
         
         # Convert season to integer (represents ending year of season)
         if 'game_season' in X.columns:
-            X['game_season'] = pd.to_numeric(X['game_season'], errors='coerce').astype('Int64')
+            X['game_season'] = pd.to_numeric(X['game_season'], errors='coerce').astype(self._dtype('Int64'))
         
         # Convert boolean columns for playoff games
         if 'game_postseason' in X.columns:
-            X['game_postseason'] = X['game_postseason'].astype(bool)
+            X['game_postseason'] = X['game_postseason'].astype(self._dtype('bool'))
         
-        # Clean text columns by stripping whitespace and handling missing values
-        for col in self.text_columns:
-            if col in X.columns:
-                X[col] = X[col].astype(str).str.strip()
-                X[col] = X[col].replace(['nan', 'None', ''], pd.NA)
+        # Same helper TextDataCleaner runs, for pipelines built without it
+        if self.clean_text:
+            X = _clean_text_columns(X, self.text_columns)
+        
+        return X
+    
+    def _transform_impl_pl(self, lf: 'pl.LazyFrame') -> 'pl.LazyFrame':
+        """Convert data types as lazy polars expressions."""
+        import polars as pl
+        schema = lf.collect_schema()
+        
+        exprs = [pl.col(col).cast(pl.Int64, strict=False) for col in self.id_columns if col in schema]
+        exprs += [pl.col(col).cast(pl.Float64, strict=False) for col in self.stat_columns if col in schema]
+        
+        if 'min' in schema:
+            if schema['min'].is_numeric():
+                minutes = pl.col('min').cast(pl.Float64)
+            else:
+                minutes_str = pl.col('min').cast(pl.String).str.strip_chars()
+                # Whitespace may surround the colon, as in "30 : 15"
+                whole_minutes = minutes_str.str.extract(r'^([^:]*)', 1).str.strip_chars().cast(pl.Float64, strict=False)
+                seconds = minutes_str.str.extract(r'^[^:]*:([^:]*)', 1).str.strip_chars()
+                minutes = (
+                    pl.when(seconds.is_null())
+                    .then(whole_minutes)
+                    .otherwise(whole_minutes + seconds.cast(pl.Float64, strict=False) / 60)
+                )
+            exprs.append(minutes.fill_nan(None).fill_null(0.0).alias('minutes_played'))
+        
+        if 'game_date' in schema:
+            if schema['game_date'] == pl.String:
+                exprs.append(pl.col('game_date').str.to_datetime(time_unit='ns', strict=False))
+            else:
+                exprs.append(pl.col('game_date').cast(pl.Datetime('ns'), strict=False))
+        
+        if 'game_season' in schema:
+            exprs.append(pl.col('game_season').cast(pl.Int64, strict=False))
+        
+        if 'game_postseason' in schema:
+            exprs.append(pl.col('game_postseason').cast(pl.Boolean))
+        
+        if self.clean_text:
+            exprs += _clean_text_exprs(self.text_columns, schema)
+        
+        lf = lf.with_columns(exprs)
+        return lf.drop('min') if 'min' in schema else lf
+    
+    def _ensure_column_major(self, X: pd.DataFrame) -> pd.DataFrame:
+        """Rebuild numeric columns whose values are strided in memory.
+        
+        Frames built from a row-major 2D array store each column as a strided
+        view, which makes column-wise reductions several times slower. Such
+        columns are regrouped by dtype and rebuilt from a Fortran-ordered copy
+        so each column occupies one contiguous buffer.
+        """
+        strided_columns: Dict[np.dtype, List[str]] = {}
+        for col, dtype in X.dtypes.items():
+            if isinstance(dtype, np.dtype) and dtype.kind in 'iufb':
+                values = X[col].to_numpy()
+                if not values.flags['C_CONTIGUOUS']:
+                    strided_columns.setdefault(dtype, []).append(col)
+        
+        if not strided_columns:
+            return X
+        
+        n_strided = sum(len(cols) for cols in strided_columns.values())
+        self._log(
+            f"Input has {n_strided} row-major numeric columns; rebuilding them as column-major. "
+            "Consider fixing the upstream reader to avoid this copy.",
+            "warning"
+        )
+        
+        for dtype, cols in strided_columns.items():
+            column_major = np.asfortranarray(X[cols].to_numpy(dtype=dtype))
+            X[cols] = pd.DataFrame(column_major, index=X.index, columns=cols)
         
         return X
 
 
+class DowncastTransformer(BaseNBATransformer):
+    """Shrink numeric columns to the narrowest dtype that holds their values.
+    
+    Box-score counts, percentages and minutes move to float32, which stores
+    counts exactly (integers up to 2**24) and keeps NaN support for the
+    missing-value step that follows; percentages and minutes keep about seven
+    significant digits, more than the source data carries. Other float
+    columns keep float64, since narrowing arbitrary values loses precision.
+    Integer columns move to int16 or int32 when their range allows. Numpy,
+    nullable and Arrow-backed columns each keep their own dtype family.
+    """
+    
+    # Narrower integer types are tried first
+    INTEGER_TYPES = (np.int16, np.int32)
+    
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        
+        # Float columns whose values are safe to store as float32
+        self.float32_columns = [
+            'fgm', 'fga', 'fg_pct', 'fg3m', 'fg3a', 'fg3_pct',
+            'ftm', 'fta', 'ft_pct', 'oreb', 'dreb', 'reb',
+            'ast', 'stl', 'blk', 'turnover', 'pf', 'pts', 'minutes_played'
+        ]
+    
+    def _transform_impl(self, X: pd.DataFrame) -> pd.DataFrame:
+        """Downcast float and integer columns where their values fit."""
+        self._log("Downcasting numeric columns...")
+        
+        numeric_cols = [
+            col for col, dtype in X.dtypes.items()
+            if dtype.kind in 'iu' or (dtype.kind == 'f' and col in self.float32_columns)
+        ]
+        if not numeric_cols:
+            return X
+        
+        # One reduction pass gives every column's range
+        ranges = X[numeric_cols].agg(['min', 'max'])
+        float32_max = np.finfo(np.float32).max
+        
+        target_dtypes = {}
+        for col in numeric_cols:
+            dtype = X[col].dtype
+            itemsize = getattr(dtype, 'numpy_dtype', dtype).itemsize
+            col_min, col_max = ranges.at['min', col], ranges.at['max', col]
+            all_missing = pd.isna(col_min)
+            
+            if dtype.kind == 'f':
+                if itemsize > 4 and (all_missing or max(abs(col_min), abs(col_max)) <= float32_max):
+                    target_dtypes[col] = self._narrow_dtype(dtype, np.float32)
+                continue
+            
+            for int_type in self.INTEGER_TYPES:
+                info = np.iinfo(int_type)
+                if itemsize <= info.bits // 8:
+                    break
+                if all_missing or (col_min >= info.min and col_max <= info.max):
+                    target_dtypes[col] = self._narrow_dtype(dtype, int_type)
+                    break
+        
+        return X.astype(target_dtypes) if target_dtypes else X
+    
+    def _transform_impl_pl(self, lf: 'pl.LazyFrame') -> 'pl.LazyFrame':
+        """Downcast the Float64 stat, percentage and minutes columns to Float32.
+        
+        Integer columns are left alone because choosing their width depends
+        on the data's value range, which is unknown until the query is collected.
+        """
+        import polars as pl
+        schema = lf.collect_schema()
+        return lf.with_columns(
+            pl.col(col).cast(pl.Float32)
+            for col, dtype in schema.items() if dtype == pl.Float64 and col in self.float32_columns
+        )
+    
+    @staticmethod
+    def _narrow_dtype(dtype, numpy_type: type):
+        """Return numpy_type in the same dtype family (numpy, nullable or Arrow) as dtype."""
+        if isinstance(dtype, pd.ArrowDtype):
+            return pd.ArrowDtype(pa.from_numpy_dtype(numpy_type))
+        if isinstance(dtype, np.dtype):
+            return np.dtype(numpy_type)
+        return pd.api.types.pandas_dtype(np.dtype(numpy_type).name.capitalize())
+
+
 class MissingValueHandler(BaseNBATransformer):
     """Handle missing values with basketball-specific logic.
     
@@ -246,12 +860,30 @@ class MissingValueHandler(BaseNBATransformer):
     to appropriately handle missing values based on the context.
     """
     
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        
+        # (percentage, attempts, makes) column triples
+        self.percentage_mappings = [
+            ('fg_pct', 'fga', 'fgm'),
+            ('fg3_pct', 'fg3a', 'fg3m'),
+            ('ft_pct', 'fta', 'ftm')
+        ]
+        
+        self.counting_stats = [
+            'fgm', 'fga', 'fg3m', 'fg3a', 'ftm', 'fta',
+            'oreb', 'dreb', 'reb', 'ast', 'stl', 'blk',
+            'turnover', 'pf', 'pts'
+        ]
+    
     def _transform_impl(self, X: pd.DataFrame) -> pd.DataFrame:
         """Handle missing values based on basketball context and statistics type."""
         self._log("Handling missing values...")
         
-        # Generate missing value report for transparency
-        missing_summary = X.isnull().sum()
+        # Generate missing value report for transparency. The counting-stat
+        # and minutes steps below reuse these counts, since the percentage
+        # repair does not touch those columns.
+        missing_summary, _ = _null_counts(X)
         missing_pct = (missing_summary / len(X)) * 100
         
         if self.verbose:
@@ -263,47 +895,66 @@ class MissingValueHandler(BaseNBATransformer):
         
         # Handle percentage columns with basketball logic
         # When no attempts are made, percentage should be 0, not missing
-        percentage_mappings = [
-            ('fg_pct', 'fga', 'fgm'),
-            ('fg3_pct', 'fg3a', 'fg3m'),
-            ('ft_pct', 'fta', 'ftm')
-        ]
-        
-        for pct_col, attempt_col, made_col in percentage_mappings:
+        for pct_col, attempt_col, made_col in self.percentage_mappings:
             if all(col in X.columns for col in [pct_col, attempt_col]):
+                # Work in the column's own float precision so float32 storage is preserved
+                pct_dtype = X[pct_col].dtype
+                float_dtype = getattr(pct_dtype, 'numpy_dtype', pct_dtype) if pct_dtype.kind == 'f' else np.float64
+                pct = X[pct_col].to_numpy(dtype=float_dtype, na_value=np.nan)
+                attempts = X[attempt_col].to_numpy(dtype=float_dtype, na_value=np.nan)
+                
+                # One NaN sweep serves both repairs: the zero-attempt and
+                # positive-attempt rows are disjoint
+                pct_missing = np.isnan(pct)
+                
                 # Set percentage to 0 when no attempts were made
-                zero_attempts_mask = (X[attempt_col] == 0) & (X[pct_col].isna())
-                X.loc[zero_attempts_mask, pct_col] = 0.0
+                pct = np.where((attempts == 0) & pct_missing, 0.0, pct)
                 
                 # Recalculate percentages where missing but attempts exist
                 if made_col in X.columns:
-                    missing_pct_mask = X[pct_col].isna() & (X[attempt_col] > 0)
+                    made = X[made_col].to_numpy(dtype=float_dtype, na_value=np.nan)
+                    missing_pct_mask = pct_missing & (attempts > 0)
                     if missing_pct_mask.any():
-                        X.loc[missing_pct_mask, pct_col] = (
-                            X.loc[missing_pct_mask, made_col] / 
-                            X.loc[missing_pct_mask, attempt_col]
-                        )
+                        np.divide(made, attempts, out=pct, where=missing_pct_mask)
+                
+                X[pct_col] = _like_column(pct, pct_dtype) if pct_dtype.kind == 'f' else pct
         
         # Handle missing statistical values based on basketball logic
         if self.config.fill_counting_stats_with_zero:
-            counting_stats = [
-                'fgm', 'fga', 'fg3m', 'fg3a', 'ftm', 'fta',
-                'oreb', 'dreb', 'reb', 'ast', 'stl', 'blk',
-                'turnover', 'pf', 'pts'
-            ]
-            
-            for col in counting_stats:
-                if col in X.columns:
-                    filled_count = X[col].isna().sum()
-                    if filled_count > 0:
-                        X[col] = X[col].fillna(0)
-                        self._log(f"  Filled {filled_count} missing values in {col} with 0")
+            cols = [col for col in self.counting_stats if col in X.columns]
+            filled_counts = missing_summary[cols]
+            if filled_counts.any():
+                X[cols] = X[cols].fillna(0)
+                for col, filled_count in filled_counts[filled_counts > 0].items():
+                    self._log(f"  Filled {filled_count} missing values in {col} with 0")
         
         # Handle missing minutes (players who didn't play have 0 minutes)
-        if 'minutes_played' in X.columns:
+        if 'minutes_played' in X.columns and missing_summary['minutes_played'] > 0:
             X['minutes_played'] = X['minutes_played'].fillna(0)
         
         return X
+    
+    def _transform_impl_pl(self, lf: 'pl.LazyFrame') -> 'pl.LazyFrame':
+        """Apply the same missing-value rules as lazy polars expressions."""
+        import polars as pl
+        schema = lf.collect_schema()
+        exprs = []
+        
+        for pct_col, attempt_col, made_col in self.percentage_mappings:
+            if pct_col in schema and attempt_col in schema:
+                pct, attempts = pl.col(pct_col), pl.col(attempt_col)
+                filled = pl.when((attempts == 0) & pct.is_null()).then(0.0)
+                if made_col in schema:
+                    filled = filled.when(pct.is_null() & (attempts > 0)).then(pl.col(made_col) / attempts)
+                exprs.append(filled.otherwise(pct).cast(schema[pct_col]).alias(pct_col))
+        
+        if self.config.fill_counting_stats_with_zero:
+            exprs += [pl.col(col).fill_null(0) for col in self.counting_stats if col in schema]
+        
+        if 'minutes_played' in schema:
+            exprs.append(pl.col('minutes_played').fill_null(0))
+        
+        return lf.with_columns(exprs)
 
 
 class DataValidator(BaseNBATransformer):
@@ -318,55 +969,60 @@ class DataValidator(BaseNBATransformer):
         self._log("Performing data validation...")
         validation_issues = []
         
+        # Read config values once; CleaningConfig is frozen so they cannot change mid-transform
+        max_minutes = self.config.max_minutes_per_game
+        auto_fix = self.config.auto_fix_inconsistencies
+        
         # Validate minutes played (maximum 60 for regulation + overtime)
         if 'minutes_played' in X.columns:
-            invalid_minutes = X[X['minutes_played'] > self.config.max_minutes_per_game]
-            if len(invalid_minutes) > 0:
-                validation_issues.append(f"Found {len(invalid_minutes)} records with >{self.config.max_minutes_per_game} minutes")
-                if self.config.auto_fix_inconsistencies:
-                    X.loc[X['minutes_played'] > self.config.max_minutes_per_game, 'minutes_played'] = self.config.max_minutes_per_game
-        
-        # Validate shot attempts and makes (made <= attempted)
-        shot_checks = [('fgm', 'fga'), ('fg3m', 'fg3a'), ('ftm', 'fta')]
-        for made_col, attempt_col in shot_checks:
-            if made_col in X.columns and attempt_col in X.columns:
-                invalid_shots = X[X[made_col] > X[attempt_col]]
-                if len(invalid_shots) > 0:
-                    validation_issues.append(f"Found {len(invalid_shots)} records where {made_col} > {attempt_col}")
-                    if self.config.auto_fix_inconsistencies:
-                        X.loc[X[made_col] > X[attempt_col], made_col] = X[attempt_col]
-        
-        # Validate total rebounds equals sum of offensive and defensive rebounds
+            if self.verbose:
+                invalid_minutes = int((X['minutes_played'] > max_minutes).sum())
+                if invalid_minutes > 0:
+                    validation_issues.append(f"Found {invalid_minutes} records with >{max_minutes} minutes")
+            if auto_fix:
+                X['minutes_played'] = X['minutes_played'].clip(upper=max_minutes)
+        
+        # Validate shot attempts and makes (made <= attempted) and that total
+        # rebounds equal offensive plus defensive rebounds
+        results = [
+            _validate_shot_pair(X, made_col, attempt_col, auto_fix, self.verbose)
+            for made_col, attempt_col in [('fgm', 'fga'), ('fg3m', 'fg3a'), ('ftm', 'fta')]
+            if made_col in X.columns and attempt_col in X.columns
+        ]
         if all(col in X.columns for col in ['reb', 'oreb', 'dreb']):
-            calculated_reb = X['oreb'] + X['dreb']
-            reb_mismatch = X[abs(X['reb'] - calculated_reb) > 0.1]
-            if len(reb_mismatch) > 0:
-                validation_issues.append(f"Found {len(reb_mismatch)} records with rebound calculation mismatches")
-                if self.config.auto_fix_inconsistencies:
-                    X['reb'] = calculated_reb
+            results.append(_validate_rebound_total(X, auto_fix, self.verbose))
+        
+        # Assign results back once every check has read its inputs
+        for col, fixed, issue in results:
+            if issue:
+                validation_issues.append(issue)
+            if fixed is not None:
+                X[col] = _like_column(fixed, X[col].dtype)
         
         # Validate percentages are between 0 and 1
         pct_columns = ['fg_pct', 'fg3_pct', 'ft_pct']
         for col in pct_columns:
             if col in X.columns:
-                invalid_pct = X[(X[col] < 0) | (X[col] > 1)]
-                if len(invalid_pct) > 0:
-                    validation_issues.append(f"Found {len(invalid_pct)} records with invalid {col} values")
-                    if self.config.auto_fix_inconsistencies:
-                        X[col] = X[col].clip(0, 1)
+                if self.verbose:
+                    invalid_pct = int(((X[col] < 0) | (X[col] > 1)).sum())
+                    if invalid_pct > 0:
+                        validation_issues.append(f"Found {invalid_pct} records with invalid {col} values")
+                if auto_fix:
+                    X[col] = X[col].clip(0, 1)
         
         # Check for extreme statistical values that may indicate data errors
-        sanity_checks = [
-            ('pts', self.config.max_reasonable_points),
-            ('reb', self.config.max_reasonable_rebounds),
-            ('ast', self.config.max_reasonable_assists)
-        ]
-        
-        for col, max_val in sanity_checks:
-            if col in X.columns:
-                extreme_values = X[X[col] > max_val]
-                if len(extreme_values) > 0:
-                    validation_issues.append(f"Found {len(extreme_values)} records with extreme {col} values (>{max_val})")
+        if self.verbose:
+            sanity_checks = [
+                ('pts', self.config.max_reasonable_points),
+                ('reb', self.config.max_reasonable_rebounds),
+                ('ast', self.config.max_reasonable_assists)
+            ]
+            
+            for col, max_val in sanity_checks:
+                if col in X.columns:
+                    extreme_values = int((X[col] > max_val).sum())
+                    if extreme_values > 0:
+                        validation_issues.append(f"Found {extreme_values} records with extreme {col} values (>{max_val})")
         
         if validation_issues and self.verbose:
             self._log("Validation issues found:")
@@ -374,6 +1030,40 @@ class DataValidator(BaseNBATransformer):
                 self._log(f"  - {issue}")
         
         return X
+    
+    def _transform_impl_pl(self, lf: 'pl.LazyFrame') -> 'pl.LazyFrame':
+        """Apply the consistency fixes lazily; issue counts are not reported."""
+        import polars as pl
+        if not self.config.auto_fix_inconsistencies:
+            return lf
+        
+        schema = lf.collect_schema()
+        exprs = []
+        
+        if 'minutes_played' in schema:
+            exprs.append(pl.col('minutes_played').clip(upper_bound=self.config.max_minutes_per_game))
+        
+        for made_col, attempt_col in [('fgm', 'fga'), ('fg3m', 'fg3a'), ('ftm', 'fta')]:
+            if made_col in schema and attempt_col in schema:
+                made, attempts = pl.col(made_col), pl.col(attempt_col)
+                exprs.append(pl.when(made > attempts).then(attempts).otherwise(made).alias(made_col))
+        
+        if all(col in schema for col in ['reb', 'oreb', 'dreb']):
+            calculated_reb = pl.col('oreb') + pl.col('dreb')
+            # As on the pandas path, a missing total is filled from known parts
+            reb_mismatch = ((pl.col('reb') - calculated_reb).abs() > 0.1) | (
+                pl.col('reb').is_null() & calculated_reb.is_not_null()
+            )
+            exprs.append(
+                pl.when(reb_mismatch)
+                .then(calculated_reb)
+                .otherwise(pl.col('reb'))
+                .alias('reb')
+            )
+        
+        exprs += [pl.col(col).clip(0, 1) for col in ['fg_pct', 'fg3_pct', 'ft_pct'] if col in schema]
+        
+        return lf.with_columns(exprs)
 
 
 class OutlierDetector(BaseNBATransformer):
@@ -383,27 +1073,23 @@ class OutlierDetector(BaseNBATransformer):
     methods and can flag, cap, or remove them based on configuration.
     """
     
+    # Bounds calculation and outlier handling for each configured option
+    _BOUNDS_METHODS: Dict[str, Callable] = {"iqr": _iqr_bounds, "zscore": _zscore_bounds}
+    _ACTIONS: Dict[str, Callable] = {"flag": _flag_outliers, "cap": _cap_outliers, "remove": _remove_outliers}
+    
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.outlier_bounds_: Dict[str, Tuple[float, float]] = {}
     
     def _calculate_outlier_bounds(self, series: pd.Series) -> Tuple[float, float]:
         """Calculate outlier bounds based on configured method."""
-        if self.config.outlier_method == "iqr":
-            Q1 = series.quantile(0.25)
-            Q3 = series.quantile(0.75)
-            IQR = Q3 - Q1
-            lower_bound = Q1 - self.config.outlier_threshold * IQR
-            upper_bound = Q3 + self.config.outlier_threshold * IQR
-        elif self.config.outlier_method == "zscore":
-            mean = series.mean()
-            std = series.std()
-            lower_bound = mean - self.config.outlier_threshold * std
-            upper_bound = mean + self.config.outlier_threshold * std
-        else:
-            raise ValueError(f"Unknown outlier method: {self.config.outlier_method}")
-        
-        return lower_bound, upper_bound
+        method = self.config.outlier_method
+        if method not in self._BOUNDS_METHODS:
+            raise ValueError(f"Unknown outlier method: {method}")
+        if series.empty:
+            # As with pandas quantile/std, no data gives undefined bounds that flag nothing
+            return np.nan, np.nan
+        return self._BOUNDS_METHODS[method](series.to_numpy(dtype=np.float64), self.config.outlier_threshold)
     
     def fit(self, X: pd.DataFrame, y=None):
         """Fit the outlier detector by calculating bounds for each statistic."""
@@ -416,29 +1102,28 @@ class OutlierDetector(BaseNBATransformer):
             if col in X.columns:
                 self.outlier_bounds_[col] = self._calculate_outlier_bounds(X[col].dropna())
         
+        self._apply_action_ = self._compile_transform()
         self._store_input_info(X)
         return self
     
+    def _compile_transform(self) -> Callable:
+        """Bind the configured action to the fitted bounds.
+        
+        The method, action and bounds are fixed once fitted, so transform calls
+        a single pre-selected function instead of branching per column. A
+        functools.partial of module-level functions keeps the fitted detector
+        picklable for the stage cache.
+        """
+        bounds = tuple(
+            (col, float(lower_bound), float(upper_bound))
+            for col, (lower_bound, upper_bound) in self.outlier_bounds_.items()
+        )
+        return partial(self._ACTIONS[self.config.outlier_action], bounds=bounds)
+    
     def _transform_impl(self, X: pd.DataFrame) -> pd.DataFrame:
         """Detect and handle outliers based on fitted bounds."""
         self._log(f"Detecting outliers using {self.config.outlier_method} method...")
-        outlier_summary = {}
-        
-        for col, (lower_bound, upper_bound) in self.outlier_bounds_.items():
-            if col in X.columns:
-                outliers_mask = (X[col] < lower_bound) | (X[col] > upper_bound)
-                outlier_count = outliers_mask.sum()
-                outlier_summary[col] = outlier_count
-                
-                if self.config.outlier_action == "flag":
-                    # Add a flag column to identify outliers
-                    X[f'{col}_outlier_flag'] = outliers_mask
-                elif self.config.outlier_action == "cap":
-                    # Cap outliers at the bounds
-                    X[col] = X[col].clip(lower_bound, upper_bound)
-                elif self.config.outlier_action == "remove":
-                    # Remove outlier records entirely
-                    X = X[~outliers_mask]
+        X, outlier_summary = self._apply_action_(X, count_outliers=self.verbose)
         
         if self.verbose and outlier_summary:
             self._log("Outlier detection summary:")
@@ -446,6 +1131,28 @@ class OutlierDetector(BaseNBATransformer):
                 self._log(f"  {col}: {count} outliers detected")
         
         return X
+    
+    def _transform_impl_pl(self, lf: 'pl.LazyFrame') -> 'pl.LazyFrame':
+        """Flag, cap or remove outliers lazily using the bounds learned in fit."""
+        import polars as pl
+        schema = lf.collect_schema()
+        action = self.config.outlier_action
+        exprs = []
+        
+        for col, (lower_bound, upper_bound) in self.outlier_bounds_.items():
+            if col in schema:
+                lower_bound, upper_bound = float(lower_bound), float(upper_bound)
+                # Missing values are never outliers, matching the pandas comparison semantics
+                outliers_mask = ((pl.col(col) < lower_bound) | (pl.col(col) > upper_bound)).fill_null(False)
+                
+                if action == "flag":
+                    exprs.append(outliers_mask.alias(f'{col}_outlier_flag'))
+                elif action == "cap":
+                    exprs.append(pl.col(col).clip(lower_bound, upper_bound))
+                elif action == "remove":
+                    lf = lf.filter(~outliers_mask)
+        
+        return lf.with_columns(exprs) if exprs else lf
 
 
 class TextDataCleaner(BaseNBATransformer):
@@ -476,20 +1183,17 @@ class TextDataCleaner(BaseNBATransformer):
         text_columns = ['player_first_name', 'player_last_name', 'player_position', 
                        'team_abbreviation', 'team_full_name']
         
-        for col in text_columns:
+        # Strip whitespace and replace missing-value placeholders with pandas NA
+        X = _clean_text_columns(X, text_columns)
+        
+        # Team labels repeat on every row, so store them as categorical codes
+        for col in ['team_abbreviation', 'team_full_name']:
             if col in X.columns:
-                # Strip whitespace and standardize text format
-                X[col] = X[col].astype(str).str.strip()
-                # Replace various representations of missing values with pandas NA
-                X[col] = X[col].replace(['nan', 'None', ''], pd.NA)
+                X[col] = X[col].astype('category')
         
         # Standardize position names for consistency
         if 'player_position' in X.columns and self.config.standardize_positions:
-            X['player_position_standardized'] = (
-                X['player_position']
-                .map(self.position_mapping)
-                .fillna(X['player_position'])
-            )
+            X['player_position_standardized'] = self._standardize_positions(X['player_position'])
         
         # Create full player name for easier identification
         if (self.config.create_full_names and 
@@ -500,6 +1204,54 @@ class TextDataCleaner(BaseNBATransformer):
             )
         
         return X
+    
+    def _transform_impl_pl(self, lf: 'pl.LazyFrame') -> 'pl.LazyFrame':
+        """Clean and standardize text columns as lazy polars expressions."""
+        import polars as pl
+        schema = lf.collect_schema()
+        text_columns = ['player_first_name', 'player_last_name', 'player_position',
+                        'team_abbreviation', 'team_full_name']
+        
+        lf = lf.with_columns(_clean_text_exprs(text_columns, schema))
+        
+        exprs = [pl.col(col).cast(pl.Categorical) for col in ['team_abbreviation', 'team_full_name'] if col in schema]
+        
+        if 'player_position' in schema and self.config.standardize_positions:
+            exprs.append(
+                pl.col('player_position')
+                .replace(self.position_mapping)
+                .cast(pl.Categorical)
+                .alias('player_position_standardized')
+            )
+        
+        # Missing names render as '<NA>', as astype(str) does on the pandas path
+        if (self.config.create_full_names and
+                all(col in schema for col in ['player_first_name', 'player_last_name'])):
+            exprs.append(
+                pl.concat_str([
+                    pl.col('player_first_name').fill_null('<NA>'),
+                    pl.lit(' '),
+                    pl.col('player_last_name').fill_null('<NA>')
+                ]).alias('player_full_name')
+            )
+        
+        return lf.with_columns(exprs)
+    
+    def _standardize_positions(self, positions: pd.Series) -> pd.Categorical:
+        """Map raw positions to standardized names, looking up each distinct value once.
+        
+        The result is categorical. player_position itself keeps the string dtype
+        from text cleaning rather than becoming categorical, because downstream
+        feature engineering maps it to numeric averages, which a categorical
+        would not allow.
+        """
+        codes, raw_positions = pd.factorize(positions)
+        standardized = pd.Index([self.position_mapping.get(pos, pos) for pos in raw_positions])
+        categories = standardized.unique()
+        
+        # Trailing -1 keeps missing positions (code -1) missing after the lookup
+        code_map = np.append(categories.get_indexer(standardized), -1)
+        return pd.Categorical.from_codes(code_map[codes], categories=categories)
 
 
 class FinalQualityChecker(BaseNBATransformer):
@@ -517,30 +1269,42 @@ class FinalQualityChecker(BaseNBATransformer):
         
         # Check for and remove duplicate player-game combinations
         if all(col in X.columns for col in ['player_id', 'game_id']):
-            duplicate_check = X.duplicated(subset=['player_id', 'game_id']).sum()
+            X, duplicate_check = _dedup_on_int_keys(X, 'player_id', 'game_id')
             if duplicate_check > 0:
-                self._log(f"Found and removing {duplicate_check} duplicate player-game combinations")
-                X = X.drop_duplicates(subset=['player_id', 'game_id'])
+                self._log(f"Found and removed {duplicate_check} duplicate player-game combinations")
         
         # Sort by date and player for consistent ordering
         if all(col in X.columns for col in ['game_date', 'player_id']):
-            X = X.sort_values(['game_date', 'player_id']).reset_index(drop=True)
-        
-        # Final missing value check and reporting
-        final_missing = X.isnull().sum()
-        critical_missing = final_missing[final_missing > 0]
+            X = _sort_by_date_and_player(X)
         
-        if len(critical_missing) > 0 and self.verbose:
-            self._log("Remaining missing values:")
-            for col, count in critical_missing.items():
-                pct = (count / len(X)) * 100
-                self._log(f"  {col}: {count} ({pct:.2f}%)")
+        # Final missing value check and reporting; one sweep, only when it is logged
+        if self.verbose:
+            final_missing, _ = _null_counts(X)
+            critical_missing = final_missing[final_missing > 0]
+            
+            if len(critical_missing) > 0:
+                self._log("Remaining missing values:")
+                for col, count in critical_missing.items():
+                    pct = (count / len(X)) * 100
+                    self._log(f"  {col}: {count} ({pct:.2f}%)")
         
         rows_removed = original_length - len(X)
         if rows_removed > 0:
             self._log(f"Removed {rows_removed} rows during final cleanup")
         
         return X
+    
+    def _transform_impl_pl(self, lf: 'pl.LazyFrame') -> 'pl.LazyFrame':
+        """Deduplicate and sort lazily; missing-value reporting is skipped."""
+        schema = lf.collect_schema()
+        
+        if all(col in schema for col in ['player_id', 'game_id']):
+            lf = lf.unique(subset=['player_id', 'game_id'], keep='first', maintain_order=True)
+        
+        if all(col in schema for col in ['game_date', 'player_id']):
+            lf = lf.sort(['game_date', 'player_id'], nulls_last=True, maintain_order=True)
+        
+        return lf
 
 
 class DataQualityAnalyzer:
@@ -565,6 +1329,8 @@ class DataQualityAnalyzer:
     
     def create_cleaning_dashboard(self, cleaning_report: Dict, initial_scores: np.ndarray, final_scores: np.ndarray) -> None:
         """Create comprehensive dashboard showing improvements from data cleaning."""
+        import matplotlib.pyplot as plt
+        
         fig, axes = plt.subplots(2, 3, figsize=(18, 10))
         fig.suptitle('Data Processing Pipeline: Quality Improvements', fontsize=16, fontweight='bold')
         
@@ -637,23 +1403,53 @@ class NBADataCleaner:
                  include_outlier_detection: bool = True,
                  include_text_cleaning: bool = True,
                  include_final_checks: bool = True,
+                 cache_dir: Optional[Union[str, Path]] = None,
+                 backend: str = "pandas",
                  verbose: bool = True):
         """
         Initialize the data cleaning pipeline with configurable components.
         
         Args:
             config: Configuration object (uses default if None)
-            include_*: Boolean flags to enable/disable specific cleaning steps
+            include_*: Boolean flags to enable/disable specific cleaning steps.
+                Numeric downcasting (config.downcast_numeric_dtypes) runs as
+                part of type conversion and is skipped when that is disabled.
+            cache_dir: Optional directory for caching the fitted pipeline across fit calls
+            backend: "pandas", or "polars" to run transform as one fused lazy query.
+                Fitting always runs the pandas stages to learn parameters such
+                as outlier bounds, so fit_transform costs the same on either
+                backend and returns the fit output; polars only speeds up later
+                transform calls.
             verbose: Whether to print progress messages
         """
+        if backend not in ["pandas", "polars"]:
+            raise ValueError("backend must be 'pandas' or 'polars'")
+        if backend == "polars" and not POLARS_AVAILABLE:
+            raise ImportError("The polars backend requires the 'polars' package")
+        
         self.config = config or CleaningConfig()
         self.verbose = verbose
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        
+        # CleaningConfig is frozen, so its field dict only needs building once
+        self._config_snapshot_: Dict[str, Any] = asdict(self.config)
+        self.backend = backend
+        
+        if self.config.use_arrow_backend and not PYARROW_AVAILABLE:
+            raise ImportError("use_arrow_backend requires the 'pyarrow' package")
+        self._use_arrow_backend = self.config.use_arrow_backend
         
         # Initialize transformers based on configuration
         self.transformers = []
         
         if include_type_conversion:
-            self.transformers.append(('type_conversion', DataTypeConverter(config=self.config, verbose=verbose)))
+            self.transformers.append(('type_conversion', DataTypeConverter(
+                clean_text=not include_text_cleaning, config=self.config, verbose=verbose
+            )))
+            
+            # Downcast as early as possible: only parsed columns are numeric
+            if self.config.downcast_numeric_dtypes:
+                self.transformers.append(('downcast', DowncastTransformer(config=self.config, verbose=verbose)))
         
         if include_missing_value_handling:
             self.transformers.append(('missing_values', MissingValueHandler(config=self.config, verbose=verbose)))
@@ -672,6 +1468,16 @@ class NBADataCleaner:
         
         self.is_fitted_ = False
         self.cleaning_report_: Optional[Dict[str, Any]] = None
+        self._fit_input_ref_: Optional[weakref.ref] = None
+        # Null total of the fit input with the shape and columns it was counted on
+        self._fit_null_total_: Optional[Tuple[Tuple[int, int], pd.Index, int]] = None
+        self._output_dtypes_: Dict[str, Any] = {}
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        """Drop the weak reference to the fit input, which cannot be pickled."""
+        state = self.__dict__.copy()
+        state['_fit_input_ref_'] = None
+        return state
     
     def fit(self, X: pd.DataFrame, y=None) -> 'NBADataCleaner':
         """
@@ -684,31 +1490,104 @@ class NBADataCleaner:
         Returns:
             self for method chaining
         """
+        self._fit(X)
+        return self
+    
+    def _fit(self, X: pd.DataFrame) -> pd.DataFrame:
+        """Fit every stage on the running output and return the final output.
+        
+        Each stage is fitted on the previous stage's output and then applied,
+        so the frame returned here is already the cleaned data for X.
+        """
         if self.verbose:
             logger.info("Fitting NBA Data Cleaning Pipeline...")
             logger.info(f"Initial dataset shape: {X.shape}")
         
-        X_temp = X.copy()
+        # Transformers never write into their input, so no defensive copy is needed
+        X_temp = self._to_arrow_backend(X) if self._use_arrow_backend else X
         
         # Fit transformers that need fitting (e.g., OutlierDetector)
-        for name, transformer in self.transformers:
-            if hasattr(transformer, 'fit') and hasattr(transformer, 'transform'):
-                transformer.fit(X_temp)
-                X_temp = transformer.transform(X_temp)
+        if self.cache_dir is not None:
+            X_temp = self._fit_cached(X_temp)
+        else:
+            for name, transformer in self.transformers:
+                if hasattr(transformer, 'fit') and hasattr(transformer, 'transform'):
+                    transformer.fit(X_temp)
+                    X_temp = transformer.transform(X_temp)
         
+        # The polars backend casts its result back to the dtypes the pandas stages produce
+        self._output_dtypes_ = X_temp.dtypes.to_dict()
+        
+        # Remember the input null total so transform on the same frame can reuse it
+        self._fit_input_ref_ = weakref.ref(X)
+        self._fit_null_total_ = (X.shape, X.columns, _null_counts(X)[1])
         self.is_fitted_ = True
         
         if self.verbose:
             logger.info("Data cleaning pipeline fitted successfully!")
         
-        return self
+        return X_temp
     
-    def transform(self, X: pd.DataFrame) -> pd.DataFrame:
+    @staticmethod
+    def _to_arrow_backend(X: pd.DataFrame) -> pd.DataFrame:
+        """Convert X to PyArrow-backed dtypes; already converted columns are kept.
+        
+        Float columns stay floating point even when every value is integral,
+        so later stages can still write fractional values into them.
+        """
+        X = X.convert_dtypes(dtype_backend="pyarrow", convert_integer=False)
+        # convert_integer=False also leaves numpy integer columns alone
+        numpy_ints = {
+            col: pd.ArrowDtype(pa.from_numpy_dtype(dtype))
+            for col, dtype in X.dtypes.items()
+            if isinstance(dtype, np.dtype) and dtype.kind in 'iu'
+        }
+        return X.astype(numpy_ints) if numpy_ints else X
+    
+    def _fit_cached(self, X: pd.DataFrame) -> pd.DataFrame:
+        """Fit the stages, reusing the cached fitted pipeline for identical input.
+        
+        Only the pipeline input is fingerprinted. The key then chains each
+        stage's name, class and configuration onto it, so no intermediate frame
+        is hashed. The fitted transformers and output dtypes are stored with
+        joblib and the final output with parquet; the dtypes are restored on
+        load because parquet does not round-trip all of them (e.g. string
+        storage).
+        """
+        key = _frame_fingerprint(X)
+        for name, transformer in self.transformers:
+            key = _fast_hash(f"{key}|{name}|{type(transformer).__name__}|{transformer.config!r}".encode())
+        transformers_path = self.cache_dir / f"pipeline_{key}.joblib"
+        output_path = self.cache_dir / f"pipeline_{key}.parquet"
+        
+        if transformers_path.exists() and output_path.exists():
+            cached = joblib.load(transformers_path)
+            self.transformers = cached['transformers']
+            if self.verbose:
+                logger.info(f"Loaded cached pipeline from {output_path}")
+            return pd.read_parquet(output_path).astype(cached['dtypes'])
+        
+        for name, transformer in self.transformers:
+            transformer.fit(X)
+            X = transformer.transform(X)
+        
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        X.to_parquet(output_path, index=True)
+        joblib.dump({'transformers': self.transformers, 'dtypes': X.dtypes.to_dict()}, transformers_path)
+        return X
+    
+    def transform(self, X: pd.DataFrame, copy: bool = False) -> pd.DataFrame:
         """
         Clean the input data using fitted transformers.
         
+        The input is not copied up front: each transformer shallow-copies its
+        input under Copy-on-Write, so only the columns it writes are duplicated
+        and the caller's frame is left unchanged.
+        
         Args:
             X: Input DataFrame
+            copy: Take a full copy of X before cleaning, e.g. when another
+                thread may modify X while the pipeline runs
             
         Returns:
             Cleaned DataFrame with all transformations applied
@@ -720,10 +1599,29 @@ class NBADataCleaner:
             logger.info("Cleaning NBA data...")
             logger.info(f"Input shape: {X.shape}")
         
-        X_clean = X.copy()
-        original_shape = X_clean.shape
+        if self.backend == "polars":
+            X_clean = self._transform_polars(X)
+        else:
+            X_clean = self._transform_pandas(X.copy() if copy else X)
+        
+        self._finish_cleaning(X, X_clean)
+        return X_clean
+    
+    def _finish_cleaning(self, X: pd.DataFrame, X_clean: pd.DataFrame) -> None:
+        """Record the cleaning report and log the shape change."""
+        # Generate comprehensive cleaning report
+        self.cleaning_report_ = self._generate_cleaning_report(X, X_clean)
+        
+        if self.verbose:
+            original_shape = X.shape
+            logger.info(f"Cleaning complete! Shape: {original_shape} -> {X_clean.shape}")
+            logger.info(f"Records removed: {original_shape[0] - X_clean.shape[0]}")
+            logger.info(f"Columns added: {X_clean.shape[1] - original_shape[1]}")
+    
+    def _transform_pandas(self, X: pd.DataFrame) -> pd.DataFrame:
+        """Apply the fitted transformers in sequence, skipping any that fail."""
+        X_clean = self._to_arrow_backend(X) if self._use_arrow_backend else X
         
-        # Apply transformers in sequence
         for name, transformer in self.transformers:
             try:
                 X_clean = transformer.transform(X_clean)
@@ -733,42 +1631,117 @@ class NBADataCleaner:
                 logger.warning(f"Error applying {name} transformer: {e}")
                 continue
         
-        # Generate comprehensive cleaning report
-        self.cleaning_report_ = self._generate_cleaning_report(X, X_clean)
+        return X_clean
+    
+    def _transform_polars(self, X: pd.DataFrame) -> pd.DataFrame:
+        """Run every transformer as one lazy polars query and collect it once.
         
-        if self.verbose:
-            logger.info(f"Cleaning complete! Shape: {original_shape} -> {X_clean.shape}")
-            logger.info(f"Records removed: {original_shape[0] - X_clean.shape[0]}")
-            logger.info(f"Columns added: {X_clean.shape[1] - original_shape[1]}")
+        Parameters such as outlier bounds are still learned by the pandas fit.
+        Per-step issue counts are not logged because nothing is materialized
+        until the final collect.
         
-        return X_clean
+        Each step's plan is resolved as it is added, so a step whose plan is
+        invalid is skipped and logged as on the pandas path. Errors that only
+        appear while the data is evaluated cannot be tied to one step; if the
+        final collect fails, the pandas transformers are run instead.
+        """
+        import polars as pl
+        
+        lf = pl.from_pandas(X).lazy()
+        
+        for name, transformer in self.transformers:
+            try:
+                step_lf = transformer._transform_impl_pl(lf)
+                step_lf.collect_schema()
+                lf = step_lf
+                if self.verbose:
+                    logger.debug(f"Added {name} transformer to polars query")
+            except Exception as e:
+                logger.warning(f"Error applying {name} transformer: {e}")
+                continue
+        
+        try:
+            X_clean = lf.collect().to_pandas()
+        except Exception as e:
+            logger.warning(f"Polars query failed ({e}); falling back to the pandas transformers")
+            return self._transform_pandas(X)
+        return self._match_fit_dtypes(X_clean)
+    
+    def _match_fit_dtypes(self, X: pd.DataFrame) -> pd.DataFrame:
+        """Cast a collected polars result to the dtypes of the pandas fit output.
+        
+        polars hands back numpy dtypes, so nullable IDs arrive as float64 and
+        text as object. Categoricals keep the fitted category order for the
+        values present in X, with unseen values appended, and an integer
+        column that no longer fits its fitted width becomes Int64.
+        """
+        for col, dtype in self._output_dtypes_.items():
+            # Unordered categoricals compare equal whatever their category order
+            if col not in X.columns or (X[col].dtype == dtype and not isinstance(dtype, pd.CategoricalDtype)):
+                continue
+            try:
+                if isinstance(dtype, pd.CategoricalDtype):
+                    values = X[col].astype(dtype.categories.dtype)
+                    present = pd.Index(values.dropna().unique())
+                    categories = dtype.categories[dtype.categories.isin(present)].append(
+                        present.difference(dtype.categories)
+                    )
+                    X[col] = values.astype(pd.CategoricalDtype(categories))
+                else:
+                    X[col] = X[col].astype(dtype)
+            except (TypeError, ValueError, OverflowError):
+                if pd.api.types.is_integer_dtype(dtype):
+                    X[col] = X[col].astype('Int64')
+        return X
     
-    def fit_transform(self, X: pd.DataFrame, y=None) -> pd.DataFrame:
+    def fit_transform(self, X: pd.DataFrame, y=None, copy: bool = False) -> pd.DataFrame:
         """
         Fit the pipeline and clean the data in one step.
         
         Args:
             X: Input DataFrame
             y: Target variable (ignored)
+            copy: Take a full copy of X before cleaning (see transform)
             
         Returns:
             Cleaned DataFrame
         """
-        return self.fit(X, y).transform(X)
+        if copy:
+            X = X.copy()
+        
+        # Fitting already runs every stage over X, so its output is the result
+        X_clean = self._fit(X)
+        self._finish_cleaning(X, X_clean)
+        return X_clean
     
     def _generate_cleaning_report(self, X_original: pd.DataFrame, X_cleaned: pd.DataFrame) -> Dict[str, Any]:
         """Generate a comprehensive report of all cleaning operations performed."""
+        original_shape, original_columns = X_original.shape, frozenset(X_original.columns)
+        
+        # Counting nulls is the costly part; reuse the fit count only while the
+        # frame is the fitted one and has not gained or lost rows or columns
+        if (self._fit_input_ref_ is not None and self._fit_input_ref_() is X_original
+                and self._fit_null_total_[0] == original_shape
+                and self._fit_null_total_[1].equals(X_original.columns)):
+            missing_before = self._fit_null_total_[2]
+        else:
+            missing_before = _null_counts(X_original)[1]
+        cleaned_columns = frozenset(X_cleaned.columns)
+        
         return {
-            'original_shape': X_original.shape,
+            'original_shape': original_shape,
             'cleaned_shape': X_cleaned.shape,
-            'rows_removed': len(X_original) - len(X_cleaned),
-            'columns_added': len(X_cleaned.columns) - len(X_original.columns),
-            'missing_values_before': X_original.isnull().sum().sum(),
-            'missing_values_after': X_cleaned.isnull().sum().sum(),
-            'new_columns': [col for col in X_cleaned.columns if col not in X_original.columns],
-            'removed_columns': [col for col in X_original.columns if col not in X_cleaned.columns],
-            'cleaning_timestamp': pd.Timestamp.now(),
-            'config_used': self.config.__dict__
+            'rows_removed': original_shape[0] - len(X_cleaned),
+            'columns_added': len(X_cleaned.columns) - original_shape[1],
+            'missing_values_before': missing_before,
+            'missing_values_after': _null_counts(X_cleaned)[1],
+            # Set lookups, iterating the frames to keep column order stable
+            'new_columns': [col for col in X_cleaned.columns if col not in original_columns],
+            'removed_columns': [col for col in X_original.columns if col not in cleaned_columns],
+            # Nanoseconds since the epoch; converted to ISO 8601 only when saved
+            'cleaning_timestamp': time.time_ns(),
+            # A shallow copy so editing one report never leaks into later ones
+            'config_used': dict(self._config_snapshot_)
         }
     
     def get_cleaning_report(self) -> Optional[Dict[str, Any]]:
@@ -778,49 +1751,78 @@ class NBADataCleaner:
     def save_cleaned_data(self, 
                          X_cleaned: pd.DataFrame, 
                          output_path: Union[str, Path], 
-                         format: str = "parquet") -> Path:
+                         format: str = "parquet",
+                         pretty: bool = False,
+                         **writer_kwargs) -> Path:
         """
         Save cleaned data with metadata.
         
+        Parquet and feather are written by converting the frame to an Arrow
+        table once and handing it straight to pyarrow. Parquet uses zstd
+        (level 3), dictionary encoding, v2 data pages of 1 MiB and row groups
+        of up to 128,000 rows; feather uses zstd. Both compress box-score
+        frames considerably better than the snappy/uncompressed defaults.
+        
         Args:
             X_cleaned: Cleaned DataFrame
             output_path: Output file path
             format: Output format ("parquet", "csv", "feather")
+            pretty: Indent the JSON cleaning report for human reading
+            **writer_kwargs: Options passed to the writer (pyarrow for parquet
+                and feather, pandas for csv), overriding the defaults above
+                (e.g. compression="snappy")
             
         Returns:
             Path to saved file
         """
         output_path = Path(output_path)
         
+        if format not in ["parquet", "csv", "feather"]:
+            raise ValueError(f"Unsupported format: {format}")
+        if format != "csv" and not PYARROW_AVAILABLE:
+            raise ImportError(f"Writing {format} output requires the 'pyarrow' package")
+        
         # Save data in specified format
         if format == "parquet":
-            X_cleaned.to_parquet(output_path, index=False)
+            parquet_options = {
+                'compression': 'zstd',
+                'compression_level': 3,
+                'row_group_size': max(1, min(len(X_cleaned), 128_000)),
+                'use_dictionary': True,
+                'data_page_size': 1 << 20,
+                'data_page_version': '2.0',
+            }
+            if 'compression' in writer_kwargs:
+                # The default level is zstd-specific and other codecs reject it
+                del parquet_options['compression_level']
+            parquet_options.update(writer_kwargs)
+            table = pa.Table.from_pandas(X_cleaned, preserve_index=False)
+            pq.write_table(table, output_path, **parquet_options)
         elif format == "csv":
-            X_cleaned.to_csv(output_path, index=False)
-        elif format == "feather":
-            X_cleaned.to_feather(output_path)
+            X_cleaned.to_csv(output_path, index=False, **writer_kwargs)
         else:
-            raise ValueError(f"Unsupported format: {format}")
+            feather_options = {'compression': 'zstd'}
+            feather_options.update(writer_kwargs)
+            table = pa.Table.from_pandas(X_cleaned, preserve_index=False)
+            pa_feather.write_feather(table, output_path, **feather_options)
         
         # Save cleaning report alongside data
         if self.cleaning_report_:
             report_path = output_path.parent / f"{output_path.stem}_cleaning_report.json"
             
-            # Convert report to JSON-serializable format
-            import json
-            report_serializable = {}
-            for key, value in self.cleaning_report_.items():
-                if isinstance(value, pd.Timestamp):
-                    report_serializable[key] = value.isoformat()
-                elif isinstance(value, np.integer):
-                    report_serializable[key] = int(value)
-                elif isinstance(value, np.floating):
-                    report_serializable[key] = float(value)
-                else:
-                    report_serializable[key] = value
+            report = dict(self.cleaning_report_)
+            report['cleaning_timestamp'] = datetime.fromtimestamp(
+                report['cleaning_timestamp'] / 1e9, tz=timezone.utc
+            ).isoformat()
             
-            with open(report_path, 'w') as f:
-                json.dump(report_serializable, f, indent=2)
+            # Both encoders only call _json_default for values they cannot encode natively
+            if ORJSON_AVAILABLE:
+                options = orjson.OPT_INDENT_2 if pretty else 0
+                with open(report_path, 'wb') as f:
+                    f.write(orjson.dumps(report, default=_json_default, option=options))
+            else:
+                with open(report_path, 'w') as f:
+                    json.dump(report, f, indent=2 if pretty else None, default=_json_default)
             
             logger.info(f"Cleaning report saved to: {report_path}")
         
@@ -830,14 +1832,26 @@ class NBADataCleaner:
 
 def assess_data_quality(df: pd.DataFrame) -> Dict[str, Any]:
     """Comprehensive data quality assessment for NBA statistics."""
-    missing = df.isnull().sum()
+    missing, missing_total = _null_counts(df)
+    
+    # Count numeric columns from the dtypes alone instead of building a sub-frame
+    numeric_cols = sum(
+        1 for dtype in df.dtypes
+        if pd.api.types.is_numeric_dtype(dtype) and not pd.api.types.is_bool_dtype(dtype)
+    )
+    
+    date_range = 'N/A'
+    if 'game_date' in df:
+        date_bounds = df['game_date'].agg(['min', 'max'])
+        date_range = f"{date_bounds['min']} to {date_bounds['max']}"
+    
     return {
         'shape': df.shape,
         'missing_cols': len(missing[missing > 0]),
-        'missing_total': missing.sum(),
-        'numeric_cols': len(df.select_dtypes(include=[np.number]).columns),
-        'date_range': f"{df['game_date'].min()} to {df['game_date'].max()}" if 'game_date' in df else 'N/A',
-        'seasons': sorted(df['game_season'].unique()) if 'game_season' in df else []
+        'missing_total': missing_total,
+        'numeric_cols': numeric_cols,
+        'date_range': date_range,
+        'seasons': sorted(pd.unique(df['game_season'].values)) if 'game_season' in df else []
     }
 
 
@@ -891,7 +1905,9 @@ def create_minimal_cleaner(verbose: bool = True) -> NBADataCleaner:
 # Analysis and visualization functions
 def analyze_cleaning_impact(df_original: pd.DataFrame, 
                           df_cleaned: pd.DataFrame,
-                          target_columns: List[str] = None) -> Dict[str, Any]:
+                          target_columns: List[str] = None,
+                          original_shape: Optional[Tuple[int, int]] = None,
+                          original_null_total: Optional[int] = None) -> Dict[str, Any]:
     """
     Analyze the impact of data cleaning on the dataset.
     
@@ -899,9 +1915,13 @@ def analyze_cleaning_impact(df_original: pd.DataFrame,
     data quality, missing values, and statistical properties.
     
     Args:
-        df_original: Original dataset before cleaning
+        df_original: Original dataset before cleaning; may hold only the
+            target columns when original_shape and original_null_total are given
         df_cleaned: Dataset after cleaning
         target_columns: Specific columns to analyze (default: ['pts', 'reb', 'ast'])
+        original_shape: Shape of the full original dataset (default: df_original.shape)
+        original_null_total: Missing-cell count of the full original dataset
+            (default: counted from df_original)
         
     Returns:
         Dictionary containing detailed analysis results
@@ -909,31 +1929,41 @@ def analyze_cleaning_impact(df_original: pd.DataFrame,
     if target_columns is None:
         target_columns = ['pts', 'reb', 'ast']
     
+    if original_shape is None:
+        original_shape = df_original.shape
+    if original_null_total is None:
+        _, original_null_total = _null_counts(df_original)
+    missing_before = original_null_total
+    _, missing_after = _null_counts(df_cleaned)
+    
     analysis = {
         'shape_change': {
-            'before': df_original.shape,
+            'before': original_shape,
             'after': df_cleaned.shape,
-            'rows_removed': len(df_original) - len(df_cleaned),
-            'columns_added': len(df_cleaned.columns) - len(df_original.columns)
+            'rows_removed': original_shape[0] - len(df_cleaned),
+            'columns_added': len(df_cleaned.columns) - original_shape[1]
         },
         'missing_data': {
-            'before': df_original.isnull().sum().sum(),
-            'after': df_cleaned.isnull().sum().sum(),
-            'improvement': df_original.isnull().sum().sum() - df_cleaned.isnull().sum().sum()
+            'before': missing_before,
+            'after': missing_after,
+            'improvement': missing_before - missing_after
         },
         'target_statistics': {}
     }
     
-    # Analyze changes in target column statistics
-    for col in target_columns:
-        if col in df_original.columns and col in df_cleaned.columns:
+    # Analyze changes in target column statistics, one aggregation per frame
+    cols = [col for col in target_columns if col in df_original.columns and col in df_cleaned.columns]
+    if cols:
+        before = df_original[cols].agg(['mean', 'std', 'count'])
+        after = df_cleaned[cols].agg(['mean', 'std', 'count'])
+        for col in cols:
             analysis['target_statistics'][col] = {
-                'mean_before': df_original[col].mean(),
-                'mean_after': df_cleaned[col].mean(),
-                'std_before': df_original[col].std(),
-                'std_after': df_cleaned[col].std(),
-                'missing_before': df_original[col].isnull().sum(),
-                'missing_after': df_cleaned[col].isnull().sum()
+                'mean_before': before.at['mean', col],
+                'mean_after': after.at['mean', col],
+                'std_before': before.at['std', col],
+                'std_after': after.at['std', col],
+                'missing_before': len(df_original) - int(before.at['count', col]),
+                'missing_after': len(df_cleaned) - int(after.at['count', col])
             }
     
     return analysis
@@ -942,18 +1972,24 @@ def analyze_cleaning_impact(df_original: pd.DataFrame,
 def plot_cleaning_comparison(df_original: pd.DataFrame,
                            df_cleaned: pd.DataFrame,
                            columns: List[str] = None,
-                           figsize: Tuple[int, int] = (15, 10)) -> None:
+                           figsize: Tuple[int, int] = (15, 10),
+                           save_path: Optional[Union[str, Path]] = None,
+                           show: bool = True) -> None:
     """
     Create visualizations comparing data before and after cleaning.
     
     Generates distribution plots for specified columns showing the impact
-    of data cleaning on statistical properties.
+    of data cleaning on statistical properties. matplotlib is imported only
+    when a figure is actually drawn.
     
     Args:
         df_original: Original dataset
         df_cleaned: Cleaned dataset  
         columns: Columns to visualize (default: ['pts', 'reb', 'ast'])
         figsize: Figure size
+        save_path: Optional path to save the figure (not saved if None)
+        show: Display the figure; when False it is rendered off-screen
+            without initializing a GUI backend
     """
     if columns is None:
         columns = ['pts', 'reb', 'ast']
@@ -966,46 +2002,56 @@ def plot_cleaning_comparison(df_original: pd.DataFrame,
         return
     
     n_cols = len(available_columns)
-    fig, axes = plt.subplots(2, n_cols, figsize=figsize)
+    if show:
+        import matplotlib.pyplot as plt
+        fig, axes = plt.subplots(2, n_cols, figsize=figsize, layout='constrained')
+    else:
+        # A bare Figure renders with Agg and never touches pyplot's GUI backend
+        from matplotlib.figure import Figure
+        fig = Figure(figsize=figsize, layout='constrained')
+        axes = fig.subplots(2, n_cols)
     
     if n_cols == 1:
         axes = axes.reshape(-1, 1)
     
     fig.suptitle('Data Cleaning Impact: Before vs After', fontsize=16, fontweight='bold')
     
+    # Before cleaning on the top row, after cleaning on the bottom row
+    rows = [
+        (df_original, 'Before', 'red', 'darkred'),
+        (df_cleaned, 'After', 'blue', 'darkblue'),
+    ]
+    
     for i, col in enumerate(available_columns):
-        # Before cleaning - top row
-        axes[0, i].hist(df_original[col].dropna(), bins=50, alpha=0.7, 
-                       color='red', edgecolor='black', density=True)
-        axes[0, i].set_title(f'{col.upper()} - Before Cleaning')
-        axes[0, i].set_ylabel('Density')
-        axes[0, i].grid(True, alpha=0.3)
-        
-        # Add statistics annotations
-        mean_before = df_original[col].mean()
-        std_before = df_original[col].std()
-        axes[0, i].axvline(mean_before, color='darkred', linestyle='--', linewidth=2)
-        axes[0, i].text(0.7, 0.9, f'μ={mean_before:.1f}\nσ={std_before:.1f}', 
-                       transform=axes[0, i].transAxes, bbox=dict(boxstyle='round', facecolor='white', alpha=0.8))
-        
-        # After cleaning - bottom row
-        axes[1, i].hist(df_cleaned[col].dropna(), bins=50, alpha=0.7,
-                       color='blue', edgecolor='black', density=True)
-        axes[1, i].set_title(f'{col.upper()} - After Cleaning')
-        axes[1, i].set_xlabel(f'{col.capitalize()}')
-        axes[1, i].set_ylabel('Density')
-        axes[1, i].grid(True, alpha=0.3)
-        
-        # Add statistics annotations
-        mean_after = df_cleaned[col].mean()
-        std_after = df_cleaned[col].std()
-        axes[1, i].axvline(mean_after, color='darkblue', linestyle='--', linewidth=2)
-        axes[1, i].text(0.7, 0.9, f'μ={mean_after:.1f}\nσ={std_after:.1f}', 
-                       transform=axes[1, i].transAxes, bbox=dict(boxstyle='round', facecolor='white', alpha=0.8))
-    
-    plt.tight_layout()
-    plt.savefig("../outputs/visuals/EDA/data_cleaning_impact.png", dpi=300, bbox_inches='tight', transparent=True)
-    plt.show()
+        for row, (data, stage, color, line_color) in enumerate(rows):
+            ax = axes[row, i]
+            
+            # One float32 array feeds the histogram and the annotations
+            values = data[col].to_numpy(dtype=np.float32, na_value=np.nan)
+            values = values[~np.isnan(values)]
+            
+            # Density histogram computed once with NumPy and drawn as bars
+            counts, edges = np.histogram(values, bins=50, density=True)
+            ax.bar(edges[:-1], counts, width=np.diff(edges), align='edge',
+                   alpha=0.7, color=color, edgecolor='black')
+            ax.set_title(f'{col.upper()} - {stage} Cleaning')
+            ax.set_ylabel('Density')
+            ax.grid(True, alpha=0.3)
+            if row == 1:
+                ax.set_xlabel(f'{col.capitalize()}')
+            
+            # Add statistics annotations
+            mean_value = values.mean() if values.size else np.nan
+            std_value = values.std(ddof=1) if values.size > 1 else np.nan
+            ax.axvline(mean_value, color=line_color, linestyle='--', linewidth=2)
+            ax.text(0.7, 0.9, f'μ={mean_value:.1f}\nσ={std_value:.1f}', 
+                    transform=ax.transAxes, bbox=dict(boxstyle='round', facecolor='white', alpha=0.8))
+    
+    if save_path is not None:
+        fig.savefig(save_path, dpi=120, transparent=True)
+    
+    if show:
+        plt.show()
 
 
 def validate_cleaned_data(df: pd.DataFrame, 
@@ -1042,22 +2088,30 @@ def validate_cleaned_data(df: pd.DataFrame,
         validation_results['date_column_is_datetime'] = pd.api.types.is_datetime64_any_dtype(df['game_date'])
     
     # Check for reasonable data ranges based on basketball rules
+    stat_bounds = {'pts': (0, 150), 'reb': (0, 50), 'ast': (0, 50)}
+    range_columns = [stat for stat in target_stats if stat in stat_bounds and stat in df.columns]
     validation_results['reasonable_data_ranges'] = True
-    for stat in target_stats:
-        if stat in df.columns:
-            if stat == 'pts' and (df[stat].max() > 150 or df[stat].min() < 0):
-                validation_results['reasonable_data_ranges'] = False
-            elif stat in ['reb', 'ast'] and (df[stat].max() > 50 or df[stat].min() < 0):
-                validation_results['reasonable_data_ranges'] = False
+    if range_columns:
+        # One aggregation pass yields every column's min and max
+        stats = df[range_columns].agg(['min', 'max']).astype('float64')
+        lower = pd.Series({stat: stat_bounds[stat][0] for stat in range_columns})
+        upper = pd.Series({stat: stat_bounds[stat][1] for stat in range_columns})
+        # Negated comparisons so all-missing columns pass, as before
+        in_range = ~(stats.loc['min'] < lower) & ~(stats.loc['max'] > upper)
+        validation_results['reasonable_data_ranges'] = bool(in_range.all())
     
     # Check for excessive missing data
-    missing_pct = (df.isnull().sum() / len(df) * 100).max()
+    missing_pct = (_null_counts(df)[0] / len(df) * 100).max()
     validation_results['acceptable_missing_data'] = missing_pct < 10.0
     
     # Check for duplicates in player-game combinations
     if all(col in df.columns for col in ['player_id', 'game_id']):
-        duplicate_count = df.duplicated(subset=['player_id', 'game_id']).sum()
-        validation_results['no_duplicates'] = duplicate_count == 0
+        keys = _packed_int_keys(df, 'player_id', 'game_id')
+        if keys is not None:
+            validation_results['no_duplicates'] = np.unique(keys).size == keys.size
+        else:
+            # Only the yes/no answer matters, so any() can stop at the first duplicate
+            validation_results['no_duplicates'] = not df.duplicated(subset=['player_id', 'game_id']).any()
     
     # Overall validation status
     validation_results['overall_valid'] = all(validation_results.values())
@@ -1069,7 +2123,8 @@ def validate_cleaned_data(df: pd.DataFrame,
 def quick_clean_nba_data(df: pd.DataFrame, 
                         cleaning_level: str = "standard",
                         save_path: Optional[Union[str, Path]] = None,
-                        show_plots: bool = True) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+                        show_plots: bool = True,
+                        plot_save_path: Optional[Union[str, Path]] = None) -> Tuple[pd.DataFrame, Dict[str, Any]]:
     """
     Quick cleaning function for use in Jupyter notebooks with minimal configuration.
     
@@ -1078,6 +2133,8 @@ def quick_clean_nba_data(df: pd.DataFrame,
         cleaning_level: "minimal", "standard", or "aggressive"
         save_path: Optional path to save cleaned data
         show_plots: Whether to show before/after plots
+        plot_save_path: Optional path to save the before/after figure; it is
+            drawn and saved even when show_plots is False
         
     Returns:
         Tuple of (cleaned_dataframe, cleaning_report)
@@ -1093,8 +2150,10 @@ def quick_clean_nba_data(df: pd.DataFrame,
     else:  # standard
         cleaner = create_basic_cleaner()
     
-    # Store original for comparison
-    df_original = df.copy()
+    # Keep only what the comparison needs: the plotted columns plus summary scalars
+    original_shape = df.shape
+    _, original_null_total = _null_counts(df)
+    df_original = df[[col for col in ['pts', 'reb', 'ast'] if col in df.columns]].copy()
     
     # Clean the data
     df_cleaned = cleaner.fit_transform(df)
@@ -1103,7 +2162,9 @@ def quick_clean_nba_data(df: pd.DataFrame,
     cleaning_report = cleaner.get_cleaning_report()
     
     # Analyze impact
-    analysis = analyze_cleaning_impact(df_original, df_cleaned)
+    analysis = analyze_cleaning_impact(df_original, df_cleaned,
+                                       original_shape=original_shape,
+                                       original_null_total=original_null_total)
     
     # Print summary
     print(f"\nCleaning Complete!")
@@ -1111,9 +2172,9 @@ def quick_clean_nba_data(df: pd.DataFrame,
     print(f"   Rows removed: {analysis['shape_change']['rows_removed']:,}")
     print(f"   Missing values: {analysis['missing_data']['before']:,} -> {analysis['missing_data']['after']:,}")
     
-    # Show plots if requested
-    if show_plots:
-        plot_cleaning_comparison(df_original, df_cleaned)
+    # Show and/or save plots if requested
+    if show_plots or plot_save_path:
+        plot_cleaning_comparison(df_original, df_cleaned, save_path=plot_save_path, show=show_plots)
     
     # Save if path provided
     if save_path:
@@ -1150,8 +2211,7 @@ def create_nba_data_cleaner(target_variables: Optional[List[str]] = None,
     Returns:
         Configured NBADataCleaner instance
     """
-    config = CleaningConfig()
-    config.drop_threshold_missing_pct = missing_threshold
+    config = CleaningConfig(drop_threshold_missing_pct=missing_threshold)
     
     return NBADataCleaner(config=config, verbose=True)
 
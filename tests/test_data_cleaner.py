@@ -0,0 +1,289 @@
+"""Regression tests for the NBA data cleaning pipeline."""
+
+import logging
+
+import pandas as pd
+import pytest
+
+from nba_analytics.data_cleaner import (
+    BaseNBATransformer,
+    CleaningConfig,
+    DataTypeConverter,
+    DataValidator,
+    DowncastTransformer,
+    MinutesConverter,
+    NBADataCleaner,
+    create_minimal_cleaner,
+)
+
+logging.disable(logging.CRITICAL)
+
+
+def _rebound_frame(dtype: str) -> pd.DataFrame:
+    """Small box-score frame whose stat columns use a nullable integer dtype."""
+    return pd.DataFrame({
+        'player_id': [1, 2, 3],
+        'game_id': [10, 10, 10],
+        'reb': pd.array([5, pd.NA, 9], dtype=dtype),
+        'oreb': pd.array([2, 1, pd.NA], dtype=dtype),
+        'dreb': pd.array([4, 2, 3], dtype=dtype),
+        'fgm': pd.array([3, pd.NA, 5], dtype=dtype),
+        'fga': pd.array([2, 4, pd.NA], dtype=dtype),
+    })
+
+
+@pytest.mark.parametrize('dtype', ['Int16', 'Int64'])
+def test_validator_fixes_nullable_int_columns_with_missing_values(dtype):
+    result = DataValidator(verbose=False).fit_transform(_rebound_frame(dtype))
+
+    assert str(result['reb'].dtype) == dtype
+    assert result['reb'].iloc[0] == 6
+    assert result['reb'].iloc[2] == 9
+    assert result['fgm'].iloc[0] == 2
+    assert result['fgm'].isna().iloc[1]
+
+
+def test_validator_fills_missing_rebound_total_from_parts():
+    frame = pd.DataFrame({
+        'reb': [float('nan'), float('nan'), 7.0],
+        'oreb': [1.0, float('nan'), 2.0],
+        'dreb': [3.0, 2.0, float('nan')],
+    })
+    result = DataValidator(verbose=False).fit_transform(frame)
+
+    assert result['reb'].iloc[0] == 4.0
+    # Unknown parts leave the total as it was
+    assert result['reb'].isna().iloc[1]
+    assert result['reb'].iloc[2] == 7.0
+
+
+@pytest.mark.parametrize('dtype', ['Int16', 'Int64'])
+def test_pipeline_fits_nullable_int_columns_without_zero_fill(dtype):
+    config = CleaningConfig(fill_counting_stats_with_zero=False)
+    result = NBADataCleaner(config=config, verbose=False).fit_transform(_rebound_frame(dtype))
+
+    # Downcasting may narrow the integer width but keeps the nullable family
+    assert isinstance(result['reb'].dtype, pd.core.arrays.integer.IntegerDtype)
+    assert result['reb'].iloc[0] == 6
+
+
+def test_minutes_conversion_handles_empty_column():
+    minutes = pd.Series([], dtype=object)
+    result = MinutesConverter.convert_series_to_decimal(minutes)
+
+    assert result.empty
+    assert result.dtype == 'float64'
+
+
+def test_type_conversion_fits_empty_frame():
+    frame = pd.DataFrame({'player_id': pd.Series([], dtype=object), 'min': pd.Series([], dtype=object)})
+    result = DataTypeConverter(verbose=False).fit_transform(frame)
+
+    assert list(result.columns) == ['player_id', 'minutes_played']
+    assert len(result) == 0
+
+
+@pytest.mark.parametrize('backend', ['pandas', 'polars'])
+def test_pipeline_cleans_empty_frame(backend):
+    pytest.importorskip(backend)
+    frame = pd.DataFrame({
+        'player_id': pd.Series([], dtype='int64'),
+        'game_id': pd.Series([], dtype='int64'),
+        'min': pd.Series([], dtype=object),
+        'pts': pd.Series([], dtype='float64'),
+        'reb': pd.Series([], dtype='float64'),
+        'ast': pd.Series([], dtype='float64'),
+    })
+    result = NBADataCleaner(verbose=False, backend=backend).fit(frame).transform(frame)
+
+    assert len(result) == 0
+    assert 'minutes_played' in result.columns
+
+
+def _cache_frame() -> pd.DataFrame:
+    """Frame large enough that a single interior row is far from both ends."""
+    n_rows = 100_000
+    return pd.DataFrame({
+        'player_id': range(n_rows),
+        'game_id': [1] * n_rows,
+        'pts': [10.0] * n_rows,
+        'player_first_name': pd.array(['a'] * n_rows, dtype='string[python]'),
+    })
+
+
+def test_stage_cache_misses_when_an_interior_cell_changes(tmp_path):
+    frame = _cache_frame()
+    first = NBADataCleaner(verbose=False, cache_dir=tmp_path).fit_transform(frame)
+    cached_files = set(tmp_path.iterdir())
+
+    changed = frame.copy()
+    changed.loc[len(changed) // 2, 'pts'] = 99.0
+    second = NBADataCleaner(verbose=False, cache_dir=tmp_path).fit_transform(changed)
+
+    assert set(tmp_path.iterdir()) > cached_files
+    assert second['pts'].max() == 99.0
+    assert first['pts'].max() == 10.0
+
+
+def test_stage_cache_hit_returns_same_dtypes(tmp_path):
+    frame = _cache_frame()
+    uncached = NBADataCleaner(verbose=False, cache_dir=tmp_path).fit_transform(frame)
+    cached_files = set(tmp_path.iterdir())
+    cached = NBADataCleaner(verbose=False, cache_dir=tmp_path).fit_transform(frame)
+
+    assert set(tmp_path.iterdir()) == cached_files
+    pd.testing.assert_frame_equal(cached, uncached)
+
+
+def test_downcast_stage_follows_type_conversion():
+    with_types = NBADataCleaner(verbose=False)
+    without_types = NBADataCleaner(verbose=False, include_type_conversion=False)
+
+    assert [name for name, _ in with_types.transformers][:2] == ['type_conversion', 'downcast']
+    assert 'downcast' not in [name for name, _ in without_types.transformers]
+
+
+def test_downcast_keeps_other_float_columns_exact():
+    frame = pd.DataFrame({'pts': [10.0, 21.0], 'usage_rate': [1 / 3, 0.1]})
+    result = DowncastTransformer(verbose=False).fit_transform(frame)
+
+    assert result['pts'].dtype == 'float32'
+    assert result['usage_rate'].dtype == 'float64'
+    assert result['usage_rate'].tolist() == [1 / 3, 0.1]
+
+
+class _PandasOnlyTransformer(BaseNBATransformer):
+    """Test stage with no polars implementation."""
+
+    def _transform_impl(self, X: pd.DataFrame) -> pd.DataFrame:
+        X['pts_doubled'] = X['pts'] * 2
+        return X
+
+
+class _FailsAtCollectTransformer(_PandasOnlyTransformer):
+    """Test stage whose polars plan is valid but fails when evaluated."""
+
+    def _transform_impl_pl(self, lf):
+        import polars as pl
+        return lf.with_columns(pl.col('player_id').cast(pl.Int8))
+
+
+def _polars_frame() -> pd.DataFrame:
+    return pd.DataFrame({
+        'player_id': [1000, 2000, 3000],
+        'game_id': [1, 1, 1],
+        'pts': [10.0, 20.0, 30.0],
+    })
+
+
+@pytest.mark.parametrize('stage', [_PandasOnlyTransformer, _FailsAtCollectTransformer])
+def test_polars_backend_matches_pandas_for_custom_stages(stage):
+    pytest.importorskip('polars')
+    results = {}
+    for backend in ['pandas', 'polars']:
+        cleaner = NBADataCleaner(verbose=False, backend=backend)
+        cleaner.transformers.append(('custom', stage(verbose=False)))
+        results[backend] = cleaner.fit(_polars_frame()).transform(_polars_frame())
+
+    assert results['polars']['pts_doubled'].tolist() == [20.0, 40.0, 60.0]
+    assert results['polars']['player_id'].tolist() == results['pandas']['player_id'].tolist()
+
+
+def test_polars_backend_fills_missing_rebound_total_like_pandas():
+    pytest.importorskip('polars')
+    frame = pd.DataFrame({
+        'player_id': [1, 2],
+        'game_id': [1, 1],
+        'reb': [float('nan'), 5.0],
+        'oreb': [1.0, 1.0],
+        'dreb': [3.0, 2.0],
+    })
+    config = CleaningConfig(fill_counting_stats_with_zero=False)
+    results = {
+        backend: NBADataCleaner(config=config, verbose=False, backend=backend).fit(frame).transform(frame)
+        for backend in ['pandas', 'polars']
+    }
+
+    assert results['pandas']['reb'].tolist() == [4.0, 3.0]
+    assert results['polars']['reb'].tolist() == [4.0, 3.0]
+
+
+def test_polars_backend_returns_pandas_dtypes():
+    pytest.importorskip('polars')
+    frame = pd.DataFrame({
+        'player_id': [1, 2, 3],
+        'game_id': [10, 10, 10],
+        'player_team_id': [1.0, float('nan'), 3.0],
+        'pts': [10.0, 20.0, 30.0],
+        'player_first_name': ['Ann', ' Bo ', 'None'],
+        'team_abbreviation': ['BOS', 'LAL', 'BOS'],
+    })
+    results = {
+        backend: NBADataCleaner(verbose=False, backend=backend).fit(frame).transform(frame)
+        for backend in ['pandas', 'polars']
+    }
+
+    pd.testing.assert_series_equal(results['polars'].dtypes, results['pandas'].dtypes)
+    assert results['polars']['player_team_id'].isna().tolist() == [False, True, False]
+
+
+def test_polars_fit_transform_returns_fit_output():
+    pytest.importorskip('polars')
+    frame = _polars_frame()
+    cleaner = NBADataCleaner(verbose=False, backend='polars')
+
+    pd.testing.assert_frame_equal(cleaner.fit_transform(frame), NBADataCleaner(verbose=False).fit_transform(frame))
+
+
+def test_report_reflects_rows_dropped_in_place_after_fit():
+    frame = pd.DataFrame({
+        'player_id': [1, 2, 3, 4],
+        'game_id': [1, 1, 1, 1],
+        'pts': [10.0, float('nan'), 30.0, 40.0],
+    })
+    cleaner = NBADataCleaner(verbose=False).fit(frame)
+    frame.drop(index=1, inplace=True)
+    cleaner.transform(frame)
+    report = cleaner.get_cleaning_report()
+
+    assert report['original_shape'] == (3, 3)
+    assert report['missing_values_before'] == 0
+
+
+@pytest.mark.parametrize('value', ['30:15', '30 : 15', ' 30: 15 '])
+def test_minutes_conversion_allows_spaces_around_colon(value):
+    assert MinutesConverter.convert_to_decimal(value) == 30.25
+    assert MinutesConverter.convert_series_to_decimal(pd.Series([value])).tolist() == [30.25]
+
+
+def test_polars_minutes_conversion_allows_spaces_around_colon():
+    pytest.importorskip('polars')
+    frame = pd.DataFrame({'player_id': [1, 2], 'game_id': [1, 1], 'min': ['30 : 15', '12: 30']})
+    result = NBADataCleaner(verbose=False, backend='polars').fit(frame).transform(frame)
+
+    assert result['minutes_played'].tolist() == [30.25, 12.5]
+
+
+@pytest.mark.parametrize('backend', ['pandas', 'polars'])
+def test_pipeline_without_text_cleaning_normalizes_placeholders(backend):
+    pytest.importorskip(backend)
+    frame = pd.DataFrame({
+        'player_id': [1, 2, 3],
+        'game_id': [1, 1, 1],
+        'player_first_name': [' Ann ', 'nan', 'None'],
+        'player_position': ['G', '', None],
+    })
+    cleaner = NBADataCleaner(verbose=False, include_text_cleaning=False, backend=backend)
+    result = cleaner.fit(frame).transform(frame)
+
+    assert result['player_first_name'].iloc[0] == 'Ann'
+    assert result['player_first_name'].iloc[1:].isna().all()
+    assert result['player_position'].iloc[1:].isna().all()
+
+
+def test_minimal_cleaner_normalizes_text_placeholders():
+    frame = pd.DataFrame({'player_id': [1, 2], 'game_id': [1, 1], 'team_abbreviation': [' BOS', 'None']})
+    result = create_minimal_cleaner(verbose=False).fit_transform(frame)
+
+    assert result['team_abbreviation'].iloc[0] == 'BOS'
+    assert pd.isna(result['team_abbreviation'].iloc[1])